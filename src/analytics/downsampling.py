@@ -0,0 +1,35 @@
+import numpy as np
+import numpy.typing as npt
+
+IntArray = npt.NDArray[np.intp]
+
+
+def lttb(x: npt.ArrayLike, y: npt.ArrayLike, threshold: int) -> IntArray:
+    # Largest-Triangle-Three-Buckets: returns the indices of the points to keep.
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    size = len(x)
+
+    if threshold >= size or threshold < 3:
+        return np.arange(size)
+
+    indices = np.empty(threshold, dtype=np.intp)
+    indices[0], indices[-1] = 0, size - 1
+
+    # The first and last points are always kept, the rest is split evenly.
+    edges = np.linspace(1, size - 1, threshold - 1).astype(np.intp)
+    selected = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else size
+        next_x = x[end:next_end].mean() if next_end > end else x[-1]
+        next_y = y[end:next_end].mean() if next_end > end else y[-1]
+
+        areas = np.abs(
+            (x[selected] - next_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (next_y - y[selected])
+        )
+        selected = start + int(np.argmax(areas))
+        indices[i + 1] = selected
+
+    return indices
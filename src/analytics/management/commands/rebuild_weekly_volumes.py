@@ -0,0 +1,37 @@
+from argparse import ArgumentParser
+from datetime import timedelta
+from typing import Any
+
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from analytics.rollups import rebuild_weekly_volumes
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--weeks",
+            type=int,
+            help="Only rebuild the last N weeks (defaults to the whole history).",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        weeks = options["weeks"]
+        since = (
+            timezone.localdate() - timedelta(weeks=weeks - 1)
+            if weeks is not None
+            else None
+        )
+
+        self.stdout.write("Rebuilding weekly muscle volumes...")
+
+        nb_rollups = self._rebuild(since, options["batch_size"])
+
+        self.stdout.write(f"Successfully rebuilt {nb_rollups} weekly volume(s)!")
+
+    @transaction.atomic
+    def _rebuild(self, since: Any, batch_size: int) -> int:
+        return rebuild_weekly_volumes(since, batch_size)
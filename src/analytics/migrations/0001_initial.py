@@ -0,0 +1,62 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WeeklyMuscleVolume",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("week", models.DateField()),
+                (
+                    "muscle",
+                    models.CharField(
+                        choices=[
+                            ("chest", "Chest"),
+                            ("triceps", "Triceps"),
+                            ("shoulders", "Shoulders"),
+                            ("quadriceps", "Quadriceps"),
+                            ("hamstring", "Hamstring"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                ("tonnage", models.DecimalField(decimal_places=1, max_digits=12)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="weekly_muscle_volumes",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["user", "-week"], name="analytics_volume_user_week"
+                    )
+                ],
+                "unique_together": {("user", "week", "muscle")},
+            },
+        ),
+    ]
@@ -1,3 +1,19 @@
+from django.contrib.auth.models import User
 from django.db import models
 
-# Create your models here.
+from exercises.models import MuscleActivation
+
+
+class WeeklyMuscleVolume(models.Model):
+    week = models.DateField()
+    muscle = models.CharField(max_length=50, choices=MuscleActivation.Muscles.choices)
+    tonnage = models.DecimalField(max_digits=12, decimal_places=1)
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="weekly_muscle_volumes"
+    )
+
+    class Meta:
+        unique_together = (("user", "week", "muscle"),)
+        indexes = [
+            models.Index(fields=["user", "-week"], name="analytics_volume_user_week"),
+        ]
@@ -0,0 +1,130 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from django.db.models import DateField, DecimalField, F, Sum
+from django.db.models.functions import TruncWeek
+from django.utils import timezone
+
+from analytics.models import WeeklyMuscleVolume
+from exercises.models import MuscleActivation
+from workout_performance.models import ExerciseSetPerformance
+
+ACTIVATION_LOOKUP = "exercise_set__workout_exercise__exercise__muscles_activation"
+
+# activation_level goes from 1 to 10, a fully activated muscle gets the whole set.
+MAX_ACTIVATION_LEVEL = 10
+
+VolumeKey = tuple[int, date, str]
+
+
+def week_start(moment: datetime) -> date:
+    day = timezone.localtime(moment).date()
+    return day - timedelta(days=day.weekday())
+
+
+def add_weekly_volumes(
+    performances: Iterable[ExerciseSetPerformance], exercise_ids: dict[int, int]
+) -> None:
+    performances = list(performances)
+    if not performances:
+        return
+
+    activations: dict[int, list[tuple[str, int]]] = defaultdict(list)
+    for exercise_id, muscle, level in MuscleActivation.objects.filter(
+        exercise__in=set(exercise_ids.values())
+    ).values_list("exercise_id", "muscle", "activation_level"):
+        activations[exercise_id].append((muscle, level))
+
+    tonnages: dict[VolumeKey, Decimal] = defaultdict(Decimal)
+    for performance in performances:
+        if performance.user_id is None:
+            continue
+
+        volume = performance.weight * performance.repetitions_done
+        week = week_start(performance.date)
+        for muscle, level in activations[exercise_ids[performance.exercise_set_id]]:
+            tonnages[(performance.user_id, week, muscle)] += (
+                volume * level / MAX_ACTIVATION_LEVEL
+            )
+
+    if not tonnages:
+        return
+
+    rollups = {
+        (rollup.user_id, rollup.week, rollup.muscle): rollup
+        for rollup in WeeklyMuscleVolume.objects.select_for_update().filter(
+            user__in={user_id for user_id, _, _ in tonnages},
+            week__in={week for _, week, _ in tonnages},
+        )
+    }
+
+    rollups_to_create = []
+    rollups_to_update = []
+    for (user_id, week, muscle), tonnage in tonnages.items():
+        rollup = rollups.get((user_id, week, muscle))
+        if rollup is None:
+            rollups_to_create.append(
+                WeeklyMuscleVolume(
+                    user_id=user_id,
+                    week=week,
+                    muscle=muscle,
+                    tonnage=round(tonnage, 1),
+                )
+            )
+        else:
+            rollup.tonnage = round(rollup.tonnage + tonnage, 1)
+            rollups_to_update.append(rollup)
+
+    WeeklyMuscleVolume.objects.bulk_create(rollups_to_create)
+    WeeklyMuscleVolume.objects.bulk_update(rollups_to_update, ["tonnage"])
+
+
+def rebuild_weekly_volumes(since: date | None = None, batch_size: int = 1000) -> int:
+    performances = ExerciseSetPerformance.objects.filter(
+        user__isnull=False, **{f"{ACTIVATION_LOOKUP}__isnull": False}
+    )
+    rollups = WeeklyMuscleVolume.objects.all()
+    if since is not None:
+        since = since - timedelta(days=since.weekday())
+        performances = performances.filter(date__date__gte=since)
+        rollups = rollups.filter(week__gte=since)
+
+    rows = (
+        performances.annotate(
+            week=TruncWeek("date", output_field=DateField()),
+            muscle=F(f"{ACTIVATION_LOOKUP}__muscle"),
+        )
+        .values("user_id", "week", "muscle")
+        .annotate(
+            tonnage=Sum(
+                F("weight")
+                * F("repetitions_done")
+                * F(f"{ACTIVATION_LOOKUP}__activation_level"),
+                output_field=DecimalField(max_digits=12, decimal_places=1),
+            )
+        )
+        .order_by()
+    )
+
+    rollups.delete()
+
+    created = 0
+    batch: list[WeeklyMuscleVolume] = []
+    for row in rows.iterator(chunk_size=batch_size):
+        batch.append(
+            WeeklyMuscleVolume(
+                user_id=row["user_id"],
+                week=row["week"],
+                muscle=row["muscle"],
+                tonnage=round(row["tonnage"] / MAX_ACTIVATION_LEVEL, 1),
+            )
+        )
+
+        if len(batch) >= batch_size:
+            created += len(WeeklyMuscleVolume.objects.bulk_create(batch))
+            batch = []
+
+    created += len(WeeklyMuscleVolume.objects.bulk_create(batch))
+    return created
@@ -0,0 +1,106 @@
+from collections.abc import Callable
+from datetime import timedelta
+from itertools import groupby
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.db.models import DecimalField, F, Max, Sum
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+from django.utils import timezone
+
+from analytics.downsampling import lttb
+from analytics.models import WeeklyMuscleVolume
+from analytics.rollups import week_start
+from exercises.models import Exercise, MuscleActivation
+from workout_performance.models import ExerciseSetPerformance
+from workout_performance.services import EXERCISE_LOOKUP
+
+BUCKETS: dict[str, Callable[[str], Any]] = {
+    "day": TruncDay,
+    "week": TruncWeek,
+    "month": TruncMonth,
+}
+DEFAULT_BUCKET = "week"
+DEFAULT_MAX_POINTS = 200
+MAX_POINTS_LIMIT = 1000
+VOLUME_WEEKS = 12
+
+
+def _downsample(
+    timestamps: list[int], values: list[float], max_points: int
+) -> list[list[float]]:
+    indices = lttb(timestamps, values, max_points)
+    return [[timestamps[i], values[i]] for i in indices]
+
+
+def strength_series(
+    user: User,
+    bucket: str = DEFAULT_BUCKET,
+    max_points: int = DEFAULT_MAX_POINTS,
+    exercise_id: int | None = None,
+) -> list[dict[str, Any]]:
+    performances = ExerciseSetPerformance.objects.filter(user=user)
+    if exercise_id is not None:
+        performances = performances.filter(**{EXERCISE_LOOKUP: exercise_id})
+
+    rows = (
+        performances.annotate(
+            exercise=F(EXERCISE_LOOKUP), bucket=BUCKETS[bucket]("date")
+        )
+        .values("exercise", "bucket")
+        .annotate(
+            best_estimated_max=Max("estimated_max"),
+            volume=Sum(
+                F("weight") * F("repetitions_done"),
+                output_field=DecimalField(max_digits=12, decimal_places=1),
+            ),
+        )
+        .order_by("exercise", "bucket")
+    )
+
+    grouped = {
+        exercise: list(exercise_rows)
+        for exercise, exercise_rows in groupby(rows, key=lambda row: row["exercise"])
+    }
+    names = dict(Exercise.objects.filter(pk__in=grouped).values_list("pk", "name"))
+
+    series = []
+    for exercise, exercise_rows in grouped.items():
+        timestamps = [int(row["bucket"].timestamp() * 1000) for row in exercise_rows]
+        estimated_maxes = [float(row["best_estimated_max"]) for row in exercise_rows]
+        volumes = [float(row["volume"]) for row in exercise_rows]
+
+        series.append(
+            {
+                "exercise": exercise,
+                "name": Exercise.Exercises(names[exercise]).label,
+                "estimated_max": _downsample(timestamps, estimated_maxes, max_points),
+                "volume": _downsample(timestamps, volumes, max_points),
+                "buckets": len(timestamps),
+            }
+        )
+
+    return series
+
+
+def weekly_muscle_volumes(user: User, weeks: int = VOLUME_WEEKS) -> dict[str, Any]:
+    last_week = week_start(timezone.now())
+    week_list = [last_week - timedelta(weeks=i) for i in reversed(range(weeks))]
+
+    tonnages = {
+        (week, muscle): float(tonnage)
+        for week, muscle, tonnage in WeeklyMuscleVolume.objects.filter(
+            user=user, week__gte=week_list[0]
+        ).values_list("week", "muscle", "tonnage")
+    }
+
+    return {
+        "weeks": [week.isoformat() for week in week_list],
+        "muscles": [
+            {
+                "muscle": label,
+                "tonnage": [tonnages.get((week, muscle), 0.0) for week in week_list],
+            }
+            for muscle, label in MuscleActivation.Muscles.choices
+        ],
+    }
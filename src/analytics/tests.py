@@ -1,3 +1,42 @@
-from django.test import TestCase
+import numpy as np
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from analytics.downsampling import lttb
+from analytics.services import _downsample
+
+
+class LTTBTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.x = np.arange(1000, dtype=np.float64)
+        self.y = np.sin(self.x / 25) * 100
+
+    def test_keeps_the_first_and_last_points(self) -> None:
+        indices = lttb(self.x, self.y, 50)
+
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], len(self.x) - 1)
+
+    def test_returns_threshold_increasing_indices(self) -> None:
+        for threshold in (3, 10, 999):
+            with self.subTest(threshold):
+                indices = lttb(self.x, self.y, threshold)
+
+                self.assertEqual(len(indices), threshold)
+                self.assertTrue(np.all(np.diff(indices) > 0))
+
+    def test_keeps_a_spike(self) -> None:
+        y = np.zeros(1000)
+        y[537] = 100
+
+        self.assertIn(537, lttb(self.x, y, 20))
+
+    def test_short_series_are_returned_unchanged(self) -> None:
+        timestamps = [0, 10, 20, 30]
+        values = [1.0, 3.0, 2.0, 5.0]
+
+        for threshold in (4, 10):
+            with self.subTest(threshold):
+                self.assertEqual(
+                    _downsample(timestamps, values, threshold),
+                    [[0, 1.0], [10, 3.0], [20, 2.0], [30, 5.0]],
+                )
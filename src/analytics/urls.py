@@ -1,5 +1,8 @@
 from django.urls import path
 
-from .views import UserStatsView
+from .views import UserStatsSeriesView, UserStatsView
 
-urlpatterns = [path("<int:pk>/", UserStatsView.as_view(), name="analytics")]
+urlpatterns = [
+    path("<int:pk>/", UserStatsView.as_view(), name="analytics"),
+    path("<int:pk>/series/", UserStatsSeriesView.as_view(), name="analytics_series"),
+]
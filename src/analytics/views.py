@@ -1,5 +1,67 @@
+from typing import Any
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.contrib.auth.models import User
+from django.http import HttpRequest, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.views import View
 from django.views.generic import TemplateView
 
+from analytics.services import (
+    BUCKETS,
+    DEFAULT_BUCKET,
+    DEFAULT_MAX_POINTS,
+    MAX_POINTS_LIMIT,
+    strength_series,
+    weekly_muscle_volumes,
+)
+from exercises.models import Exercise
+
 
-class UserStatsView(TemplateView):
+class UserStatsView(LoginRequiredMixin, TemplateView):
     template_name = "analytics/analytics.html"
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context["stats_user"] = stats_user = get_object_or_404(
+            User, pk=self.kwargs["pk"]
+        )
+        context["muscle_volumes"] = weekly_muscle_volumes(stats_user)
+        context["exercises"] = Exercise.objects.order_by("pk")
+        context["buckets"] = list(BUCKETS)
+        context["default_bucket"] = DEFAULT_BUCKET
+        return context
+
+
+class UserStatsSeriesView(LoginRequiredMixin, View):
+    def get(self, request: HttpRequest, pk: int) -> JsonResponse:
+        stats_user = get_object_or_404(User, pk=pk)
+
+        bucket = request.GET.get("bucket", DEFAULT_BUCKET)
+        if bucket not in BUCKETS:
+            return JsonResponse(
+                {"errors": f"Bucket must be one of: {', '.join(BUCKETS)}."},
+                status=400,
+            )
+
+        points = request.GET.get("points", str(DEFAULT_MAX_POINTS))
+        exercise = request.GET.get("exercise")
+        if not points.isdigit() or (exercise and not exercise.isdigit()):
+            return JsonResponse(
+                {"errors": "Points and exercise must be numbers."}, status=400
+            )
+
+        max_points = min(max(int(points), 3), MAX_POINTS_LIMIT)
+        return JsonResponse(
+            {
+                "user": stats_user.pk,
+                "bucket": bucket,
+                "points": max_points,
+                "series": strength_series(
+                    stats_user,
+                    bucket,
+                    max_points,
+                    int(exercise) if exercise else None,
+                ),
+            }
+        )
@@ -0,0 +1,123 @@
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple
+from urllib.parse import urlencode
+
+import numpy as np
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from common.query_budget import QueryBudgetClient
+from groups.models import Group
+from training_plans.models import TrainingPlan
+
+PERCENTILES = (50, 90, 95, 99)
+
+Result = dict[str, Any]
+
+
+class BenchmarkSubject(NamedTuple):
+    user: User
+    group: Group
+    training_plan: TrainingPlan
+
+
+def _url(name: str, pk: int | None = None, **query: str) -> str:
+    url = reverse(name, kwargs={"pk": pk} if pk is not None else None)
+    return f"{url}?{urlencode(query)}" if query else url
+
+
+BENCHMARKS: dict[str, Callable[[BenchmarkSubject], str]] = {
+    "FriendSearchView": lambda subject: _url(
+        "friend_search", q=subject.user.first_name[:3]
+    ),
+    "FriendListView": lambda subject: _url("friend_list"),
+    "GroupSearchView": lambda subject: _url(
+        "group_search", q=subject.group.name.split()[0]
+    ),
+    "GroupDashboardView": lambda subject: _url("group_dashboard"),
+    "GroupDetailView": lambda subject: _url("group_detail", subject.group.pk),
+    "NotificationListView": lambda subject: _url("notification_list"),
+    "TrainingPlanDetailView": lambda subject: _url(
+        "training_plan_detail", subject.training_plan.pk
+    ),
+}
+
+
+def pick_subject() -> BenchmarkSubject:
+    # The host of the largest group sees the busiest pages, picked the same way
+    # on every run so that results stay comparable between commits.
+    groups = Group.objects.select_related("admin_user").order_by("-member_count", "pk")
+    group = groups[0]
+    training_plan = TrainingPlan.objects.filter(user=group.admin_user).order_by("pk")[0]
+    return BenchmarkSubject(group.admin_user, group, training_plan)
+
+
+def run_benchmark(
+    client: QueryBudgetClient, url: str, iterations: int, warmup: int
+) -> Result:
+    for _ in range(warmup):
+        client.get(url)
+
+    timings = []
+    queries = 0
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            response = client.get(url)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        if response.status_code != 200:
+            raise ValueError(f"{url} answered with {response.status_code}")
+        queries = max(queries, len(context.captured_queries))
+
+    return {
+        "url": url,
+        "iterations": iterations,
+        "queries": queries,
+        "mean_ms": round(float(np.mean(timings)), 3),
+        **{
+            f"p{percentile}_ms": round(float(value), 3)
+            for percentile, value in zip(
+                PERCENTILES, np.percentile(timings, PERCENTILES)
+            )
+        },
+    }
+
+
+def run_benchmarks(
+    subject: BenchmarkSubject, iterations: int, warmup: int
+) -> dict[str, Result]:
+    # Going over a declared query budget fails the run like it fails the tests.
+    client = QueryBudgetClient()
+    client.force_login(subject.user)
+    return {
+        name: run_benchmark(client, url(subject), iterations, warmup)
+        for name, url in BENCHMARKS.items()
+    }
+
+
+def find_regressions(
+    results: dict[str, Result],
+    baseline: dict[str, Result],
+    threshold: float,
+    metric: str = "p95_ms",
+) -> list[str]:
+    # Latency may drift within the threshold, any extra query is a regression.
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+
+        if result["queries"] > previous["queries"]:
+            regressions.append(
+                f"{name}: {previous['queries']} -> {result['queries']} queries"
+            )
+        if result[metric] > previous[metric] * (1 + threshold):
+            regressions.append(
+                f"{name}: {metric} {previous[metric]} -> {result[metric]}"
+            )
+    return regressions
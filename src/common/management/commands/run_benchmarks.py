@@ -0,0 +1,142 @@
+import json
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import BaseCommand, CommandError, call_command
+from django.db import connection
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from common.benchmarks import (
+    BenchmarkSubject,
+    Result,
+    find_regressions,
+    pick_subject,
+    run_benchmarks,
+)
+from common.query_budget import QueryBudgetExceeded
+from common.seeding import users_for_scale
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--scale", type=float, default=1.0)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--workers", type=int)
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--warmup", type=int, default=5)
+        parser.add_argument("--output", type=Path, default=Path("benchmarks.json"))
+        parser.add_argument(
+            "--baseline",
+            type=Path,
+            help="Results of a previous run to compare against.",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Allowed p95 latency increase over the baseline, as a fraction.",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help=(
+                "Reuse the seeded benchmark database from a previous run with the "
+                "same --seed, it is reseeded when its size doesn't match --scale."
+            ),
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # Benchmarks run against their own database, seeded from scratch so
+        # that two runs with the same scale and seed see the same rows.
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False, keepdb=options["keepdb"]
+        )
+        try:
+            nb_users = self._seed(options)
+            with override_settings(
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+            ):
+                results = self._run(
+                    pick_subject(), options["iterations"], options["warmup"]
+                )
+        finally:
+            connection.creation.destroy_test_db(
+                old_name, verbosity=0, keepdb=options["keepdb"]
+            )
+
+        options["output"].write_text(
+            json.dumps(
+                {
+                    "created_at": timezone.now().isoformat(),
+                    "vendor": connection.vendor,
+                    "scale": options["scale"],
+                    "seed": options["seed"],
+                    "users": nb_users,
+                    "results": results,
+                },
+                indent=2,
+            )
+        )
+        self.stdout.write(f"Results written to {options['output']}")
+
+        if options["baseline"] is not None:
+            self._compare(results, options["baseline"], options["threshold"])
+
+    def _seed(self, options: dict[str, Any]) -> int:
+        nb_users = User.objects.count()
+        expected = users_for_scale(options["scale"])
+        if nb_users == expected:
+            return nb_users
+
+        # A kept database seeded at another scale would be reported as this one.
+        if nb_users:
+            self.stdout.write(
+                f"The kept database holds {nb_users} user(s) instead of {expected}, "
+                "reseeding..."
+            )
+            call_command("flush", interactive=False, verbosity=0)
+
+        seed_options = {"scale": options["scale"], "seed": options["seed"]}
+        if options["workers"] is not None:
+            seed_options["workers"] = options["workers"]
+        call_command("seed_dataset", **seed_options, stdout=self.stdout)
+        return User.objects.count()
+
+    def _run(
+        self, subject: BenchmarkSubject, iterations: int, warmup: int
+    ) -> dict[str, Result]:
+        self.stdout.write(f"Benchmarking as {subject.user.username}...")
+
+        try:
+            results = run_benchmarks(subject, iterations, warmup)
+        except (ValueError, QueryBudgetExceeded) as e:
+            raise CommandError(e)
+
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:<24} {result['queries']:>4} queries  "
+                f"p50 {result['p50_ms']:>8.2f} ms  p95 {result['p95_ms']:>8.2f} ms  "
+                f"p99 {result['p99_ms']:>8.2f} ms"
+            )
+        return results
+
+    def _compare(
+        self, results: dict[str, Result], baseline_path: Path, threshold: float
+    ) -> None:
+        try:
+            baseline = json.loads(baseline_path.read_text())["results"]
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f"Could not read the baseline {baseline_path}: {e}")
+
+        regressions = find_regressions(results, baseline, threshold)
+        if regressions:
+            raise CommandError(
+                "Performance regression(s) against the baseline:\n"
+                + "\n".join(regressions)
+            )
+
+        self.stdout.write(f"No regression against {baseline_path}")
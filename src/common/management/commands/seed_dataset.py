@@ -0,0 +1,96 @@
+import multiprocessing
+import os
+from argparse import ArgumentParser
+from collections.abc import Iterator
+from typing import Any
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management import BaseCommand, CommandError, call_command
+from django.db import connection
+from django.db.models import Max
+from django.utils import timezone
+
+from common.seeding import (
+    DEFAULT_PASSWORD,
+    USERS_PER_GROUP,
+    Task,
+    create_friendships,
+    create_groups,
+    create_training_plans,
+    create_users,
+    ensure_exercises,
+    run_tasks,
+    users_for_scale,
+)
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--scale", type=float, default=1.0)
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.batch_size = options["batch_size"]
+        self.workers = options["workers"]
+        if connection.vendor == "sqlite" and self.workers > 1:
+            # SQLite allows a single writer, parallel chunks would only wait
+            # on each other's locks.
+            self.stdout.write("SQLite only allows one writer, seeding with 1 worker")
+            self.workers = 1
+        if self.workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            raise CommandError("Parallel seeding needs fork, use --workers 1.")
+
+        nb_users = users_for_scale(options["scale"])
+        nb_groups = max(1, nb_users // USERS_PER_GROUP)
+
+        # The password is hashed once, every seeded user shares the hash.
+        state: dict[str, Any] = {
+            "seed": options["seed"],
+            "password": make_password(DEFAULT_PASSWORD),
+            "first_index": (User.objects.aggregate(Max("pk"))["pk__max"] or 0) + 1,
+            "now": timezone.now(),
+            "exercise_ids": ensure_exercises(),
+        }
+
+        user_ids: list[int] = []
+        for _, chunk_ids in self._run(create_users, nb_users, state, "user"):
+            user_ids += chunk_ids
+        state["user_ids"] = sorted(user_ids)
+
+        self._run_all(create_friendships, nb_users, state, "friendship")
+        self._run_all(create_groups, nb_groups, state, "group")
+        self._run_all(create_training_plans, nb_users, state, "training plan")
+
+        call_command("rebuild_prs", batch_size=self.batch_size, stdout=self.stdout)
+        call_command(
+            "rebuild_weekly_volumes", batch_size=self.batch_size, stdout=self.stdout
+        )
+        call_command(
+            "friendships_compute_suggestions",
+            batch_size=self.batch_size,
+            stdout=self.stdout,
+        )
+
+        self.stdout.write(f"Successfully seeded {nb_users} user(s)!")
+
+    def _run(
+        self, task: Task, total: int, state: dict[str, Any], label: str
+    ) -> Iterator[tuple[int, Any]]:
+        self.stdout.write(f"Seeding {label}(s)...")
+
+        done = 0
+        for size, result in run_tasks(
+            task, total, self.batch_size, state, self.workers
+        ):
+            done += size
+            self.stdout.write(f"Seeded {label}(s) for {done}/{total} item(s)")
+            yield size, result
+
+    def _run_all(
+        self, task: Task, total: int, state: dict[str, Any], label: str
+    ) -> None:
+        created = sum(result for _, result in self._run(task, total, state, label))
+        self.stdout.write(f"Created {created} {label}(s)")
@@ -0,0 +1,78 @@
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any, TypeVar
+
+from django.db.models import Model, Q, QuerySet
+from django.http import HttpRequest
+
+ModelT = TypeVar("ModelT", bound=Model)
+
+Cursor = tuple[datetime, int]
+
+
+def encode_cursor(value: datetime, pk: int) -> str:
+    return f"{value.isoformat()}_{pk}"
+
+
+def decode_cursor(value: str | None) -> Cursor | None:
+    if not value:
+        return None
+
+    timestamp, _, pk = value.rpartition("_")
+    try:
+        return datetime.fromisoformat(timestamp), int(pk)
+    except ValueError:
+        return None
+
+
+class KeysetPaginationMixin:
+    # Keyset pagination walks an index ending in (-keyset_field, -id) from the
+    # cursor instead of counting and skipping every row before the page.
+    request: HttpRequest
+    page_size = 10
+    keyset_field: str
+
+    def paginate_keyset(self, queryset: QuerySet[ModelT]) -> QuerySet[ModelT]:
+        self.after = decode_cursor(self.request.GET.get("after"))
+        self.before = decode_cursor(self.request.GET.get("before"))
+        field = self.keyset_field
+
+        if self.before:
+            value, pk = self.before
+            queryset = queryset.filter(
+                Q(**{f"{field}__gt": value}) | Q(**{field: value, "pk__gt": pk})
+            ).order_by(field, "pk")
+        else:
+            if self.after:
+                value, pk = self.after
+                queryset = queryset.filter(
+                    Q(**{f"{field}__lt": value}) | Q(**{field: value, "pk__lt": pk})
+                )
+            queryset = queryset.order_by(f"-{field}", "-pk")
+
+        # One extra row tells whether another page follows.
+        return queryset[: self.page_size + 1]
+
+    def get_keyset_page(
+        self, rows: Iterable[ModelT]
+    ) -> tuple[list[ModelT], dict[str, Any]]:
+        page = list(rows)
+        has_more = len(page) > self.page_size
+        page = page[: self.page_size]
+
+        if self.before:
+            page.reverse()
+            has_previous, has_next = has_more, True
+        else:
+            has_previous, has_next = self.after is not None, has_more
+
+        cursors = {
+            "previous_cursor": (
+                self._encode_cursor(page[0]) if has_previous and page else None
+            ),
+            "next_cursor": self._encode_cursor(page[-1]) if has_next and page else None,
+        }
+        return page, cursors
+
+    def _encode_cursor(self, row: Model) -> str:
+        return encode_cursor(getattr(row, self.keyset_field), row.pk)
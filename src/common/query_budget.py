@@ -0,0 +1,74 @@
+from contextlib import ContextDecorator
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import Resolver404, resolve
+
+if TYPE_CHECKING:
+    # The test client's response type only exists in django-stubs.
+    from django.test.client import _MonkeyPatchedWSGIResponse
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+# Usable both as a context manager and as a decorator, like override_settings.
+class query_budget(ContextDecorator):
+    def __init__(
+        self, max_queries: int, label: str = "", using: str = DEFAULT_DB_ALIAS
+    ) -> None:
+        self.max_queries = max_queries
+        self.label = label
+        self.using = using
+        # A decorated function may recurse, every call captures its own queries.
+        self.contexts: list[CaptureQueriesContext] = []
+
+    def __enter__(self) -> CaptureQueriesContext:
+        context = CaptureQueriesContext(connections[self.using])
+        self.contexts.append(context)
+        return context.__enter__()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        context = self.contexts.pop()
+        context.__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None or len(context) <= self.max_queries:
+            return
+
+        queries = "\n".join(
+            f"{position}. {query['sql']}"
+            for position, query in enumerate(context.captured_queries, start=1)
+        )
+        raise QueryBudgetExceeded(
+            f"{self.label or 'Block'} ran {len(context)} queries, "
+            f"over its budget of {self.max_queries}:\n{queries}"
+        )
+
+
+def get_query_budget(url_name: str | None) -> int | None:
+    return settings.QUERY_BUDGETS.get(url_name) if url_name else None
+
+
+class QueryBudgetClient(Client):
+    # Every request to a URL with a declared budget fails once it goes over.
+    def request(self, **request: Any) -> "_MonkeyPatchedWSGIResponse":
+        try:
+            url_name = resolve(request["PATH_INFO"]).url_name
+        except Resolver404:
+            url_name = None
+
+        budget = get_query_budget(url_name)
+        if budget is None:
+            return super().request(**request)
+
+        with query_budget(budget, label=url_name or ""):
+            return super().request(**request)
@@ -0,0 +1,418 @@
+import multiprocessing
+import random
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from decimal import Decimal
+from typing import Any
+
+import django
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connections, transaction
+from faker import Faker
+
+from accounts.models import Profile
+from exercises.models import Exercise, MuscleActivation
+from friendships.edges import sync_edges
+from friendships.models import FriendRequest, Friendship
+from groups.models import Group, GroupAddRequest, GroupMembership
+from notifications.models import Notification
+from training_plans.models import ExerciseSet, TrainingPlan, Workout, WorkoutExercise
+from workout_performance.estimators import get_estimator, to_estimated_max
+from workout_performance.models import ExerciseSetPerformance
+from workout_performance.scoring import relative_scores_batch
+
+# Rows generated per unit of --scale, everything else is relative to the users.
+USERS_PER_SCALE = 1000
+USERS_PER_GROUP = 20
+
+FRIENDSHIPS_PER_USER = 10
+BLOCKED_RATIO = 0.02
+MEMBERS_PER_GROUP = 25
+PENDING_REQUESTS_PER_GROUP = 3
+PUBLIC_PLAN_RATIO = 0.3
+WORKOUTS_PER_PLAN = 3
+EXERCISES_PER_WORKOUT = 2
+SETS_PER_EXERCISE = 3
+PERFORMANCES_PER_SET = 2
+
+DEFAULT_PASSWORD = "defaultpass123"
+
+EXERCISE_MUSCLES = {
+    Exercise.Exercises.BENCH_PRESS: {
+        MuscleActivation.Muscles.CHEST: 9,
+        MuscleActivation.Muscles.TRICEPS: 6,
+        MuscleActivation.Muscles.SHOULDERS: 5,
+    },
+    Exercise.Exercises.SQUAT: {
+        MuscleActivation.Muscles.QUADRICEPS: 9,
+        MuscleActivation.Muscles.HAMSTRING: 5,
+    },
+    Exercise.Exercises.DEADLIFT: {
+        MuscleActivation.Muscles.HAMSTRING: 9,
+        MuscleActivation.Muscles.QUADRICEPS: 4,
+    },
+}
+
+GROUP_SUFFIXES = ["Lifters", "Barbell Club", "Strength", "Powerlifting", "Iron"]
+
+
+def users_for_scale(scale: float) -> int:
+    return max(3, round(scale * USERS_PER_SCALE))
+
+
+# Set once per worker process by init_worker, the tasks only read from it.
+_state: dict[str, Any] = {}
+
+Task = Callable[[int, int], Any]
+
+
+def init_worker(state: dict[str, Any]) -> None:
+    django.setup()
+    _state.clear()
+    _state.update(state)
+
+
+def run_tasks(
+    task: Task, total: int, batch_size: int, state: dict[str, Any], workers: int
+) -> Iterator[tuple[int, Any]]:
+    # Yields the size and result of every finished chunk, in completion order.
+    ranges = [
+        (start, min(start + batch_size, total)) for start in range(0, total, batch_size)
+    ]
+
+    if workers <= 1:
+        init_worker(state)
+        for start, stop in ranges:
+            yield stop - start, task(start, stop)
+        return
+
+    # Workers are forked so they inherit the loaded apps and settings,
+    # including a test database name, spawned ones would import the models
+    # before the apps are ready. They must open their own connections though.
+    connections.close_all()
+    with ProcessPoolExecutor(
+        workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=init_worker,
+        initargs=(state,),
+    ) as pool:
+        futures = {
+            pool.submit(task, start, stop): stop - start for start, stop in ranges
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def ensure_exercises() -> list[int]:
+    if not Exercise.objects.exists():
+        exercises = Exercise.objects.bulk_create(
+            Exercise(name=name, description=name.label) for name in EXERCISE_MUSCLES
+        )
+        MuscleActivation.objects.bulk_create(
+            MuscleActivation(
+                exercise=exercise, muscle=muscle, activation_level=activation_level
+            )
+            for exercise in exercises
+            for muscle, activation_level in EXERCISE_MUSCLES[
+                Exercise.Exercises(exercise.name)
+            ].items()
+        )
+    return list(Exercise.objects.order_by("pk").values_list("pk", flat=True))
+
+
+def _rng(name: str, start: int) -> random.Random:
+    return random.Random(f"{_state['seed']}-{name}-{start}")
+
+
+def _faker(name: str, start: int) -> Faker:
+    fake = Faker()
+    fake.seed_instance(f"{_state['seed']}-{name}-{start}")
+    return fake
+
+
+@transaction.atomic
+def create_users(start: int, stop: int) -> list[int]:
+    rng = _rng("users", start)
+    fake = _faker("users", start)
+
+    users = []
+    for index in range(start, stop):
+        first_name, last_name = fake.first_name(), fake.last_name()
+        username = f"{first_name}-{last_name}{_state['first_index'] + index}"
+        users.append(
+            User(
+                first_name=first_name,
+                last_name=last_name,
+                username=username,
+                email=f"{username}@example.com",
+                password=_state["password"],
+            )
+        )
+    users = User.objects.bulk_create(users)
+
+    # The image is left to the field default instead of rendering one per user.
+    Profile.objects.bulk_create(
+        Profile(
+            user=user,
+            gender=rng.choice(Profile.Genders.values),
+            age=rng.randint(18, 50),
+            body_weight=Decimal(f"{rng.uniform(50, 120):.1f}"),
+        )
+        for user in users
+    )
+    return [user.pk for user in users]
+
+
+@transaction.atomic
+def create_friendships(start: int, stop: int) -> int:
+    rng = _rng("friendships", start)
+    fake = _faker("friendships", start)
+    user_ids = _state["user_ids"]
+    nb_users = len(user_ids)
+
+    # Every user befriends the users at a few random offsets below half the
+    # ring, so no pair can be drawn twice, even by another worker. The offset
+    # at exactly half the ring is never a friend and gets a pending request.
+    half = (nb_users - 1) // 2
+    if half < 2:
+        return 0
+
+    friendships = []
+    requests = []
+    for index in range(start, stop):
+        user_id = user_ids[index]
+        for offset in rng.sample(range(1, half), min(FRIENDSHIPS_PER_USER, half - 1)):
+            friend_id = user_ids[(index + offset) % nb_users]
+            low_user_id, high_user_id = Friendship.ordered_pair(user_id, friend_id)
+            blocked = rng.random() < BLOCKED_RATIO
+            friendships.append(
+                Friendship(
+                    status=(
+                        Friendship.FriendshipStatus.BLOCKED
+                        if blocked
+                        else Friendship.FriendshipStatus.ACTIVE
+                    ),
+                    blocked_at=_state["now"] if blocked else None,
+                    blocked_by_id=user_id if blocked else None,
+                    user_id=user_id,
+                    friend_id=friend_id,
+                    low_user_id=low_user_id,
+                    high_user_id=high_user_id,
+                )
+            )
+
+        requests.append(
+            FriendRequest(
+                message=fake.sentence(),
+                status=FriendRequest.RequestStatus.PENDING,
+                sender_id=user_id,
+                receiver_id=user_ids[(index + half) % nb_users],
+            )
+        )
+
+    created = Friendship.objects.bulk_create(friendships)
+    sync_edges(created)
+    FriendRequest.objects.bulk_create(requests)
+
+    users = User.objects.only("username").in_bulk(
+        {friendship.user_id for friendship in friendships}
+        | {friendship.friend_id for friendship in friendships}
+        | {request.receiver_id for request in requests}
+    )
+    notifications = [
+        (
+            Notification(
+                type=Notification.NotificationType.USER_BLOCK,
+                user=users[friendship.friend_id],
+                notification_user=users[friendship.user_id],
+            )
+            if friendship.status == Friendship.FriendshipStatus.BLOCKED
+            else Notification(
+                type=Notification.NotificationType.FRIEND_REQUEST_ACCEPTED,
+                user=users[friendship.user_id],
+                notification_user=users[friendship.friend_id],
+            )
+        )
+        for friendship in friendships
+    ]
+    notifications += [
+        Notification(
+            type=Notification.NotificationType.FRIEND_REQUEST_RECEIVED,
+            user=users[request.receiver_id],
+            notification_user=users[request.sender_id],
+        )
+        for request in requests
+    ]
+    _create_notifications(notifications)
+
+    return len(created)
+
+
+@transaction.atomic
+def create_groups(start: int, stop: int) -> int:
+    rng = _rng("groups", start)
+    fake = _faker("groups", start)
+    user_ids = _state["user_ids"]
+
+    groups = []
+    members: list[list[int]] = []
+    requesters: list[list[int]] = []
+    for _ in range(start, stop):
+        sampled = rng.sample(
+            user_ids,
+            min(MEMBERS_PER_GROUP + PENDING_REQUESTS_PER_GROUP, len(user_ids)),
+        )
+        # The first sampled user hosts the group and is always a member.
+        members.append(sampled[:MEMBERS_PER_GROUP])
+        requesters.append(sampled[MEMBERS_PER_GROUP:])
+        groups.append(
+            Group(
+                name=f"{fake.city()} {rng.choice(GROUP_SUFFIXES)}"[:50],
+                description=fake.text(max_nb_chars=500),
+                admin_user_id=sampled[0],
+                member_count=len(members[-1]),
+                pending_requests_count=len(requesters[-1]),
+            )
+        )
+    groups = Group.objects.bulk_create(groups)
+
+    GroupMembership.objects.bulk_create(
+        GroupMembership(
+            status=GroupMembership.MembershipStatus.ACCEPTED,
+            user_id=user_id,
+            group=group,
+        )
+        for group, group_members in zip(groups, members)
+        for user_id in group_members
+    )
+    GroupAddRequest.objects.bulk_create(
+        GroupAddRequest(
+            message=fake.sentence(),
+            status=GroupAddRequest.RequestStatus.PENDING,
+            user_id=user_id,
+            group=group,
+        )
+        for group, group_requesters in zip(groups, requesters)
+        for user_id in group_requesters
+    )
+
+    users = User.objects.only("username").in_bulk(
+        {group.admin_user_id for group in groups}
+        | {user_id for group_requesters in requesters for user_id in group_requesters}
+    )
+    _create_notifications(
+        Notification(
+            type=Notification.NotificationType.GROUP_REQUEST_RECEIVED,
+            user=users[group.admin_user_id],
+            notification_user=users[user_id],
+            notification_group=group,
+        )
+        for group, group_requesters in zip(groups, requesters)
+        for user_id in group_requesters
+    )
+
+    return len(groups)
+
+
+@transaction.atomic
+def create_training_plans(start: int, stop: int) -> int:
+    rng = _rng("training_plans", start)
+    fake = _faker("training_plans", start)
+    profiles = {
+        user_id: (gender, body_weight)
+        for user_id, gender, body_weight in Profile.objects.filter(
+            user__in=_state["user_ids"][start:stop]
+        ).values_list("user_id", "gender", "body_weight")
+    }
+
+    plans = TrainingPlan.objects.bulk_create(
+        TrainingPlan(
+            name=f"{fake.word().title()} Program",
+            description=fake.sentence(),
+            is_active=True,
+            is_public=rng.random() < PUBLIC_PLAN_RATIO,
+            user_id=user_id,
+        )
+        for user_id in profiles
+    )
+    workouts = Workout.objects.bulk_create(
+        Workout(
+            name=f"{day.title()} workout",
+            description=fake.sentence(),
+            day=day,
+            training_plan=plan,
+        )
+        for plan in plans
+        for day in rng.sample(Workout.Days.values, WORKOUTS_PER_PLAN)
+    )
+    workout_exercises = WorkoutExercise.objects.bulk_create(
+        WorkoutExercise(workout=workout, exercise_id=exercise_id)
+        for workout in workouts
+        for exercise_id in rng.sample(
+            _state["exercise_ids"],
+            min(EXERCISES_PER_WORKOUT, len(_state["exercise_ids"])),
+        )
+    )
+    exercise_sets = ExerciseSet.objects.bulk_create(
+        ExerciseSet(
+            set_number=set_number,
+            repetitions=rng.randint(3, 12),
+            workout_exercise=workout_exercise,
+        )
+        for workout_exercise in workout_exercises
+        for set_number in range(1, SETS_PER_EXERCISE + 1)
+    )
+
+    owners = {
+        workout_exercise.pk: workout_exercise.workout.training_plan.user_id
+        for workout_exercise in workout_exercises
+    }
+    performances = []
+    genders = []
+    for exercise_set in exercise_sets:
+        user_id = owners[exercise_set.workout_exercise_id]
+        gender, body_weight = profiles[user_id]
+        for _ in range(PERFORMANCES_PER_SET):
+            genders.append(gender)
+            weight = min(body_weight * Decimal(rng.uniform(0.5, 1.8)), Decimal(999))
+            performances.append(
+                ExerciseSetPerformance(
+                    weight=weight.quantize(Decimal("0.1")),
+                    repetitions_done=max(
+                        1, exercise_set.repetitions + rng.randint(-2, 1)
+                    ),
+                    bodyweight=body_weight,
+                    exercise_set=exercise_set,
+                    user_id=user_id,
+                )
+            )
+
+    # Scored in one vectorized pass, the records, rankings and volumes derived
+    # from them are rebuilt once the whole dataset exists.
+    estimated_maxes = get_estimator(settings.ONE_REP_MAX_FORMULA).estimate_batch(
+        [performance.weight for performance in performances],
+        [performance.repetitions_done for performance in performances],
+    )
+    for performance, estimated_max in zip(performances, estimated_maxes):
+        performance.estimated_max = to_estimated_max(estimated_max)
+    scores = relative_scores_batch(
+        [performance.estimated_max for performance in performances],
+        [performance.bodyweight for performance in performances],
+        genders,
+    )
+    for performance, score in zip(performances, scores):
+        performance.relative_score = Decimal(f"{score:.2f}")
+
+    ExerciseSetPerformance.objects.bulk_create(performances)
+
+    return len(plans)
+
+
+def _create_notifications(notifications: Iterable[Notification]) -> None:
+    # Seeded notifications are inserted directly, nobody is subscribed yet and
+    # the unread counters are read from the database on a cold cache.
+    notifications = list(notifications)
+    for notification in notifications:
+        notification.snapshot()
+    Notification.objects.bulk_create(notifications)
@@ -1,3 +1,86 @@
+from datetime import datetime, timezone
+from io import StringIO
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
 from django.test import TestCase
+from django.urls import resolve, reverse
+
+from common.benchmarks import BENCHMARKS, pick_subject
+from common.pagination import decode_cursor, encode_cursor
+from common.query_budget import (
+    QueryBudgetClient,
+    QueryBudgetExceeded,
+    query_budget,
+)
+from notifications.models import Notification
+
+
+class QueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        call_command("seed_dataset", scale=0.05, workers=1, stdout=StringIO())
+
+    def test_hot_views_stay_within_their_budget(self) -> None:
+        subject = pick_subject()
+        client = QueryBudgetClient()
+        client.force_login(subject.user)
+
+        for name, url in BENCHMARKS.items():
+            with self.subTest(name):
+                path = url(subject)
+                self.assertIn(
+                    resolve(path.split("?")[0]).url_name, settings.QUERY_BUDGETS
+                )
+                self.assertEqual(client.get(path).status_code, 200)
+
+    def test_context_manager_fails_over_budget(self) -> None:
+        with self.assertRaises(QueryBudgetExceeded), query_budget(1):
+            list(User.objects.all())
+            list(User.objects.all())
+
+    def test_decorator_allows_queries_within_budget(self) -> None:
+        @query_budget(1)
+        def count_users() -> int:
+            return User.objects.count()
+
+        self.assertEqual(count_users(), User.objects.count())
+
+
+class KeysetCursorTests(TestCase):
+    def test_cursor_round_trips(self) -> None:
+        value = datetime(2025, 6, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+
+        self.assertEqual(decode_cursor(encode_cursor(value, 42)), (value, 42))
+
+    def test_invalid_cursors_decode_to_none(self) -> None:
+        for cursor in (None, "", "garbage", "_42", "2025-06-01T12:00:00_x", "x_42"):
+            with self.subTest(cursor):
+                self.assertIsNone(decode_cursor(cursor))
+
+    def test_invalid_cursor_falls_back_to_the_first_page(self) -> None:
+        user = User.objects.create_user("reader", password="pass")
+        Notification.objects.bulk_create(
+            Notification(
+                user=user,
+                type=Notification.NotificationType.USER_KICK,
+                message=f"Notification {index}",
+            )
+            for index in range(15)
+        )
+        self.client.force_login(user)
+
+        first_page = self.client.get(reverse("notification_list"))
+        for cursor in ("garbage", "2025-13-45T00:00:00_1", "_"):
+            with self.subTest(cursor):
+                response = self.client.get(
+                    reverse("notification_list"), {"after": cursor, "before": cursor}
+                )
 
-# Create your tests here.
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    list(response.context["notifications"]),
+                    list(first_page.context["notifications"]),
+                )
+                self.assertIsNone(response.context["previous_cursor"])
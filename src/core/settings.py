@@ -14,12 +14,14 @@ ALLOWED_HOSTS: list[str] = []
 
 
 INSTALLED_APPS = [
+    "daphne",
     "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 INSTALLED_EXTENSIONS = [
@@ -58,12 +60,14 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "notifications.context_processors.unread_notifications",
             ],
         },
     },
 ]
 
 WSGI_APPLICATION = "core.wsgi.application"
+ASGI_APPLICATION = "core.asgi.application"
 
 DATABASES = {
     "default": {
@@ -112,3 +116,32 @@ LOGIN_URL = "accounts-login"
 LOGOUT_REDIRECT_URL = "common-home"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# Unread counters and friendship graphs must be shared by every web and worker
+# process. Without REDIS_URL each process keeps its own, which only suits a
+# single development server.
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+ONE_REP_MAX_FORMULA = "epley"
+
+NOTIFICATIONS_BROKER = "notifications.pubsub.LocalBroker"
+
+# Most queries each URL may run, enforced by common.query_budget.QueryBudgetClient.
+# Budgets hold with a cold cache, which adds the unread and relations lookups.
+QUERY_BUDGETS = {
+    "friend_search": 8,
+    "friend_list": 5,
+    "group_search": 8,
+    "group_dashboard": 5,
+    "group_detail": 5,
+    "notification_list": 5,
+    "training_plan_detail": 8,
+}
@@ -31,4 +31,5 @@ urlpatterns = [
     path("groups/", include("groups.urls")),
     path("notifications/", include("notifications.urls")),
     path("training_plans/", include("training_plans.urls")),
+    path("workout_performance/", include("workout_performance.urls")),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
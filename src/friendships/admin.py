@@ -1,6 +1,7 @@
 from django.contrib import admin
 
-from .models import FriendRequest, Friendship
+from .models import FriendRequest, Friendship, FriendSuggestion
 
 admin.site.register(FriendRequest)
 admin.site.register(Friendship)
+admin.site.register(FriendSuggestion)
@@ -0,0 +1,34 @@
+from collections.abc import Iterable
+
+from .models import FriendEdge, Friendship
+
+
+def _edges(friendship: Friendship) -> tuple[FriendEdge, FriendEdge]:
+    return (
+        FriendEdge(
+            owner_id=friendship.user_id,
+            friend_id=friendship.friend_id,
+            friendship_id=friendship.pk,
+            status=friendship.status,
+            created_at=friendship.created_at,
+        ),
+        FriendEdge(
+            owner_id=friendship.friend_id,
+            friend_id=friendship.user_id,
+            friendship_id=friendship.pk,
+            status=friendship.status,
+            created_at=friendship.created_at,
+        ),
+    )
+
+
+def sync_edges(friendships: Iterable[Friendship]) -> None:
+    # Every friendship is mirrored as one row per side so a user's friends are
+    # a single range scan over (owner, status). Deleting the friendship
+    # cascades to both edges.
+    FriendEdge.objects.bulk_create(
+        [edge for friendship in friendships for edge in _edges(friendship)],
+        update_conflicts=True,
+        unique_fields=["owner", "friend"],
+        update_fields=["status", "created_at", "friendship"],
+    )
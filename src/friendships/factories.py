@@ -107,8 +107,8 @@ class FriendSendRequestFactory(FriendRequestFactory):
                     Friendship.FriendshipStatus.ACTIVE,
                 ]
             ),
-            Q(user=self.sender, friend=OuterRef("pk"))
-            | Q(user=OuterRef("pk"), friend=self.sender),
+            Q(low_user=self.sender, high_user=OuterRef("pk"))
+            | Q(low_user=OuterRef("pk"), high_user=self.sender),
         )
 
         has_request = FriendRequest.objects.filter(
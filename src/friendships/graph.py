@@ -0,0 +1,74 @@
+import time
+from typing import NamedTuple, cast
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from friendships.models import Friendship
+
+GRAPH_VERSION_KEY = "friendships:graph:version:{user_id}"
+GRAPH_KEY = "friendships:graph:{user_id}:{version}"
+GRAPH_TIMEOUT = 60 * 60
+
+
+class FriendRelations(NamedTuple):
+    friends: frozenset[int]
+    blocked: frozenset[int]
+    blocked_by: frozenset[int]
+
+
+def _version(user_id: int) -> int:
+    # Versions are timestamps so a version key lost to eviction can never
+    # point back at an entry cached before the last invalidation.
+    version = cache.get_or_set(
+        GRAPH_VERSION_KEY.format(user_id=user_id), time.time_ns, None
+    )
+    return cast(int, version)
+
+
+def _load_relations(user_id: int) -> FriendRelations:
+    friends, blocked, blocked_by = set(), set(), set()
+
+    for first_id, second_id, status, blocked_by_id in (
+        Friendship.objects.filter(Q(low_user=user_id) | Q(high_user=user_id))
+        .exclude(status=Friendship.FriendshipStatus.KICKED)
+        .values_list("low_user_id", "high_user_id", "status", "blocked_by_id")
+    ):
+        other_id = second_id if first_id == user_id else first_id
+
+        if status == Friendship.FriendshipStatus.ACTIVE:
+            friends.add(other_id)
+        elif blocked_by_id == user_id:
+            blocked.add(other_id)
+        else:
+            blocked_by.add(other_id)
+
+    return FriendRelations(
+        frozenset(friends), frozenset(blocked), frozenset(blocked_by)
+    )
+
+
+def get_relations(user_id: int) -> FriendRelations:
+    # Lags behind writes still being committed, so only rendering reads it.
+    # Permission checks query the friendships themselves.
+    key = GRAPH_KEY.format(user_id=user_id, version=_version(user_id))
+
+    relations = cache.get(key)
+    if relations is None:
+        relations = _load_relations(user_id)
+        cache.set(key, relations, GRAPH_TIMEOUT)
+    return FriendRelations(*relations)
+
+
+def invalidate_relations(*user_ids: int) -> None:
+    def bump() -> None:
+        cache.set_many(
+            {
+                GRAPH_VERSION_KEY.format(user_id=user_id): time.time_ns()
+                for user_id in user_ids
+            },
+            None,
+        )
+
+    transaction.on_commit(bump)
@@ -1,59 +1,114 @@
+from argparse import ArgumentParser
 from typing import Any
 
 from django.core.management import BaseCommand
 from django.db import transaction
-from django.db.models import Q
-from django.utils import timezone
+from django.db.models import Exists, OuterRef, Q
 
+from friendships.edges import sync_edges
+from friendships.graph import invalidate_relations
 from friendships.models import FriendRequest, Friendship
 
 from notifications.models import Notification
+from notifications.services import notify_many
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+
     def handle(self, *args: Any, **options: Any) -> None:
-        self.stdout.write("Accepting request(s)...")
+        batch_size = options["batch_size"]
+        total = FriendRequest.objects.filter(
+            status=FriendRequest.RequestStatus.PENDING
+        ).count()
+
+        self.stdout.write(f"Accepting {total} request(s)...")
 
-        self._accept_requests()
+        accepted = 0
+        last_pk = 0
+        while True:
+            nb_requests, last_pk = self._accept_requests(last_pk, batch_size)
+            if not nb_requests:
+                break
+
+            accepted += nb_requests
+            self.stdout.write(f"Accepted {accepted}/{total} request(s)")
 
         self.stdout.write("Successfully accepted all requests!")
 
     @transaction.atomic
-    def _accept_requests(self) -> None:
+    def _accept_requests(self, last_pk: int, batch_size: int) -> tuple[int, int]:
         requests = list(
-            FriendRequest.objects.filter(status=FriendRequest.RequestStatus.PENDING)
+            FriendRequest.objects.select_for_update(of=("self",))
+            .filter(status=FriendRequest.RequestStatus.PENDING, pk__gt=last_pk)
+            .select_related("receiver")
+            .only("sender", "receiver__username")
+            .order_by("pk")[:batch_size]
         )
+        if not requests:
+            return 0, last_pk
 
-        FriendRequest.objects.filter(status=FriendRequest.RequestStatus.PENDING).update(
+        request_ids = [request.pk for request in requests]
+        FriendRequest.objects.filter(pk__in=request_ids).update(
             status=FriendRequest.RequestStatus.ACCEPTED
         )
 
+        # Pairs that are already friends or blocked are matched with one join
+        # against the chunk and left untouched, kicked friendships come back.
+        settled_pairs = set(
+            Friendship.objects.exclude(status=Friendship.FriendshipStatus.KICKED)
+            .filter(
+                Exists(
+                    FriendRequest.objects.filter(pk__in=request_ids).filter(
+                        Q(sender=OuterRef("low_user"), receiver=OuterRef("high_user"))
+                        | Q(sender=OuterRef("high_user"), receiver=OuterRef("low_user"))
+                    )
+                )
+            )
+            .values_list("low_user_id", "high_user_id")
+        )
+
+        friendships: dict[tuple[int, int], Friendship] = {}
+        notifications = []
         for request in requests:
-            friendship = Friendship.objects.filter(
-                Q(user=request.sender, friend=request.receiver)
-                | Q(user=request.receiver, friend=request.sender),
-                status=Friendship.FriendshipStatus.KICKED,
-            ).first()
-
-            if not friendship:
-                Friendship.objects.create(
-                    status=Friendship.FriendshipStatus.ACTIVE,
-                    user=request.sender,
-                    friend=request.receiver,
+            pair = Friendship.ordered_pair(request.sender_id, request.receiver_id)
+            if pair in settled_pairs or pair in friendships:
+                continue
+
+            friendships[pair] = Friendship(
+                status=Friendship.FriendshipStatus.ACTIVE,
+                user_id=request.sender_id,
+                friend_id=request.receiver_id,
+                low_user_id=pair[0],
+                high_user_id=pair[1],
+            )
+            notifications.append(
+                Notification(
+                    type=Notification.NotificationType.FRIEND_REQUEST_ACCEPTED,
+                    user_id=request.sender_id,
+                    notification_user=request.receiver,
                 )
-            else:
-                friendship.status = Friendship.FriendshipStatus.ACTIVE
-                friendship.created_at = timezone.now()
-                friendship.kicked_at = None
-                friendship.blocked_at = None
-                friendship.user = request.sender
-                friendship.friend = request.receiver
-                friendship.kicked_by = None
-                friendship.blocked_by = None
-                friendship.save()
-
-            Notification.objects.create(
-                type=Notification.NotificationType.FRIEND_REQUEST_ACCEPTED,
-                user=request.sender,
-                notification_user=request.receiver,
             )
+
+        created = Friendship.objects.bulk_create(
+            friendships.values(),
+            update_conflicts=True,
+            unique_fields=["low_user", "high_user"],
+            update_fields=[
+                "status",
+                "created_at",
+                "kicked_at",
+                "blocked_at",
+                "user",
+                "friend",
+                "kicked_by",
+                "blocked_by",
+            ],
+        )
+        sync_edges(created)
+        invalidate_relations(*{user_id for pair in friendships for user_id in pair})
+
+        notify_many(notifications)
+
+        return len(requests), requests[-1].pk
@@ -1,5 +1,6 @@
 import random
 from argparse import ArgumentParser
+from collections import defaultdict
 from typing import Any
 
 from django.contrib.auth.models import User
@@ -8,72 +9,96 @@ from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
 
+from friendships.edges import sync_edges
+from friendships.graph import invalidate_relations
 from friendships.models import Friendship
 
 from notifications.models import Notification
+from notifications.services import notify_many
 
 
 class Command(BaseCommand):
     def add_arguments(self, parser: ArgumentParser) -> None:
-        parser.add_argument("count", type=int, default=1)
+        parser.add_argument("count", type=int, nargs="?", default=1)
+        parser.add_argument("--batch-size", type=int, default=1000)
 
     def handle(self, *args: Any, **options: Any) -> None:
         count = options["count"]
-        users = User.objects.select_related("profile")
+        batch_size = options["batch_size"]
+
+        # Ids are read once and sampled from, instead of listing every other
+        # user for each blocker.
+        user_ids = list(User.objects.order_by("pk").values_list("pk", flat=True))
 
         self.stdout.write(f"Blocking {count} user(s) for each user...")
 
-        for user in users:
-            nb_blocked_users = self._block_users(count, user)
+        blocked = 0
+        for start in range(0, len(user_ids), batch_size):
+            blocked += self._block_users(
+                count, user_ids[start : start + batch_size], user_ids
+            )
             self.stdout.write(
-                f"Successfully blocked {nb_blocked_users} user(s) from {user.username}"
+                f"Blocked {blocked} user(s) from "
+                f"{min(start + batch_size, len(user_ids))}/{len(user_ids)} user(s)"
             )
 
-        self.stdout.write(f"Successfully blocked user(s)!")
+        self.stdout.write("Successfully blocked user(s)!")
 
     @transaction.atomic
-    def _block_users(self, count: int, user: User) -> int:
-        available_users = list(
-            User.objects.exclude(
-                Q(
-                    sent_friendships__friend=user,
-                    sent_friendships__status=Friendship.FriendshipStatus.BLOCKED,
+    def _block_users(
+        self, count: int, blocker_ids: list[int], user_ids: list[int]
+    ) -> int:
+        blockers = User.objects.only("username").in_bulk(blocker_ids)
+
+        blocked_with: dict[int, set[int]] = defaultdict(set)
+        for low_user_id, high_user_id in Friendship.objects.filter(
+            Q(low_user__in=blocker_ids) | Q(high_user__in=blocker_ids),
+            status=Friendship.FriendshipStatus.BLOCKED,
+        ).values_list("low_user_id", "high_user_id"):
+            blocked_with[low_user_id].add(high_user_id)
+            blocked_with[high_user_id].add(low_user_id)
+
+        now = timezone.now()
+        friendships: dict[tuple[int, int], Friendship] = {}
+        notifications = []
+        for blocker_id in blocker_ids:
+            excluded = blocked_with[blocker_id] | {blocker_id}
+            # Over-sample so that enough candidates remain once the user and
+            # the users already blocked either way are dropped.
+            candidates = random.sample(
+                user_ids, min(count + len(excluded), len(user_ids))
+            )
+            for user_id in [pk for pk in candidates if pk not in excluded][:count]:
+                pair = Friendship.ordered_pair(blocker_id, user_id)
+                friendships[pair] = Friendship(
+                    status=Friendship.FriendshipStatus.BLOCKED,
+                    blocked_at=now,
+                    user_id=blocker_id,
+                    friend_id=user_id,
+                    blocked_by_id=blocker_id,
+                    low_user_id=pair[0],
+                    high_user_id=pair[1],
                 )
-                | Q(
-                    accepted_friendships__user=user,
-                    accepted_friendships__status=Friendship.FriendshipStatus.BLOCKED,
+                blocked_with[user_id].add(blocker_id)
+                notifications.append(
+                    Notification(
+                        type=Notification.NotificationType.USER_BLOCK,
+                        user_id=user_id,
+                        notification_user=blockers[blocker_id],
+                    )
                 )
-                | Q(pk=user.pk)
-            )
-        )
 
-        users_to_block = random.sample(
-            available_users, min(count, len(available_users))
+        # Existing friendships keep their sides and history, only the block
+        # itself is written over them.
+        created = Friendship.objects.bulk_create(
+            friendships.values(),
+            update_conflicts=True,
+            unique_fields=["low_user", "high_user"],
+            update_fields=["status", "blocked_at", "blocked_by"],
         )
+        sync_edges(Friendship.objects.filter(pk__in=[f.pk for f in created]))
+        invalidate_relations(*{user_id for pair in friendships for user_id in pair})
 
-        for user_to_block in users_to_block:
-            friendship = Friendship.objects.filter(
-                Q(user=user, friend=user_to_block) | Q(user=user_to_block, friend=user)
-            ).first()
-
-            if not friendship:
-                Friendship.objects.create(
-                    status=Friendship.FriendshipStatus.BLOCKED,
-                    user=user,
-                    friend=user_to_block,
-                    blocked_at=timezone.now(),
-                    blocked_by=user,
-                )
-            else:
-                friendship.status = Friendship.FriendshipStatus.BLOCKED
-                friendship.blocked_at = timezone.now()
-                friendship.blocked_by = user
-                friendship.save()
-
-            Notification.objects.create(
-                type=Notification.NotificationType.USER_BLOCK,
-                user=user_to_block,
-                notification_user=user,
-            )
+        notify_many(notifications)
 
-        return len(users_to_block)
+        return len(friendships)
@@ -0,0 +1,19 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management import BaseCommand
+
+from friendships.suggestions import DEFAULT_TOP_K, compute_suggestions
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K)
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.stdout.write("Computing friend suggestions...")
+
+        nb_suggestions = compute_suggestions(options["top_k"], options["batch_size"])
+
+        self.stdout.write(f"Successfully stored {nb_suggestions} suggestion(s)!")
@@ -6,6 +6,7 @@ from django.db import transaction
 from friendships.models import FriendRequest
 
 from notifications.models import Notification
+from notifications.services import notify_many
 
 
 class Command(BaseCommand):
@@ -19,16 +20,20 @@ class Command(BaseCommand):
     @transaction.atomic
     def _decline_requests(self) -> None:
         requests = list(
-            FriendRequest.objects.filter(status=FriendRequest.RequestStatus.PENDING)
+            FriendRequest.objects.filter(
+                status=FriendRequest.RequestStatus.PENDING
+            ).select_related("sender", "receiver")
         )
 
         FriendRequest.objects.filter(status=FriendRequest.RequestStatus.PENDING).update(
             status=FriendRequest.RequestStatus.DECLINED
         )
 
-        for request in requests:
-            Notification.objects.create(
+        notify_many(
+            Notification(
                 type=Notification.NotificationType.FRIEND_REQUEST_DECLINED,
                 user=request.sender,
                 notification_user=request.receiver,
             )
+            for request in requests
+        )
@@ -5,9 +5,12 @@ from django.core.management import BaseCommand
 from django.db import transaction
 from django.utils import timezone
 
+from friendships.edges import sync_edges
+from friendships.graph import invalidate_relations
 from friendships.models import Friendship
 
 from notifications.models import Notification
+from notifications.services import notify_many
 
 
 class Command(BaseCommand):
@@ -20,21 +23,28 @@ class Command(BaseCommand):
 
     @transaction.atomic
     def _kick_friends(self) -> None:
-        friendships = Friendship.objects.filter(
-            status=Friendship.FriendshipStatus.ACTIVE
+        friendships = list(
+            Friendship.objects.filter(status=Friendship.FriendshipStatus.ACTIVE)
         )
+        notifications = []
         for friendship in friendships:
             friendship.status = Friendship.FriendshipStatus.KICKED
             friendship.kicked_at = timezone.now()
             friendship.kicked_by = random.choice([friendship.user, friendship.friend])
             friendship.save()
-
-            Notification.objects.create(
-                type=Notification.NotificationType.USER_KICK,
-                user=(
-                    friendship.user
-                    if friendship.kicked_by == friendship.friend
-                    else friendship.friend
-                ),
-                notification_user=friendship.kicked_by,
+            invalidate_relations(friendship.user_id, friendship.friend_id)
+
+            notifications.append(
+                Notification(
+                    type=Notification.NotificationType.USER_KICK,
+                    user=(
+                        friendship.user
+                        if friendship.kicked_by == friendship.friend
+                        else friendship.friend
+                    ),
+                    notification_user=friendship.kicked_by,
+                )
             )
+
+        sync_edges(friendships)
+        notify_many(notifications)
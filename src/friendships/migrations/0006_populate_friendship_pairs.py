@@ -0,0 +1,43 @@
+from collections import defaultdict
+
+from django.db import migrations
+from django.db.models import Case, F, When
+
+# When both directions of a pair exist, keep the row carrying the strongest
+# relationship, then the most recent one.
+STATUS_PRIORITY = {"blocked": 2, "active": 1, "kicked": 0}
+
+
+def populate_pairs(apps, schema_editor):
+    Friendship = apps.get_model("friendships", "Friendship")
+
+    Friendship.objects.update(
+        low_user=Case(When(user__lt=F("friend"), then=F("user")), default=F("friend")),
+        high_user=Case(When(user__lt=F("friend"), then=F("friend")), default=F("user")),
+    )
+
+    pairs = defaultdict(list)
+    for pk, low_user, high_user, status in Friendship.objects.values_list(
+        "pk", "low_user", "high_user", "status"
+    ).order_by("pk"):
+        pairs[(low_user, high_user)].append((STATUS_PRIORITY[status], pk))
+
+    duplicates = [
+        pk
+        for rows in pairs.values()
+        if len(rows) > 1
+        for _, pk in sorted(rows, reverse=True)[1:]
+    ]
+    for i in range(0, len(duplicates), 1000):
+        Friendship.objects.filter(pk__in=duplicates[i : i + 1000]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("friendships", "0005_friendship_low_user_high_user"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_pairs, migrations.RunPython.noop),
+    ]
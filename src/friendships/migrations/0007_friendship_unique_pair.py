@@ -0,0 +1,44 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("friendships", "0006_populate_friendship_pairs"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="friendship",
+            unique_together=set(),
+        ),
+        migrations.AlterField(
+            model_name="friendship",
+            name="high_user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="high_friendships",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="friendship",
+            name="low_user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="low_friendships",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="friendship",
+            constraint=models.UniqueConstraint(
+                fields=("low_user", "high_user"), name="friendships_unique_pair"
+            ),
+        ),
+    ]
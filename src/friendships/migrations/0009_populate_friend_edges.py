@@ -0,0 +1,46 @@
+from django.db import migrations
+
+
+def populate_edges(apps, schema_editor):
+    Friendship = apps.get_model("friendships", "Friendship")
+    FriendEdge = apps.get_model("friendships", "FriendEdge")
+
+    edges = []
+    for pk, user, friend, status, created_at in Friendship.objects.values_list(
+        "pk", "user", "friend", "status", "created_at"
+    ).iterator(chunk_size=1000):
+        edges.append(
+            FriendEdge(
+                owner_id=user,
+                friend_id=friend,
+                friendship_id=pk,
+                status=status,
+                created_at=created_at,
+            )
+        )
+        edges.append(
+            FriendEdge(
+                owner_id=friend,
+                friend_id=user,
+                friendship_id=pk,
+                status=status,
+                created_at=created_at,
+            )
+        )
+
+        if len(edges) >= 1000:
+            FriendEdge.objects.bulk_create(edges)
+            edges = []
+
+    FriendEdge.objects.bulk_create(edges)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("friendships", "0008_friendedge"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_edges, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,25 @@
+from __future__ import annotations
+
 from django.db import models
 from django.contrib.auth.models import User
+from django.db.models import Case, F, Q, QuerySet, When
+from typing import Any
+
+
+class FriendshipQuerySet(QuerySet["Friendship"]):
+    def between(self, user: User, other: User) -> FriendshipQuerySet:
+        low_user, high_user = Friendship.ordered_pair(user.pk, other.pk)
+        return self.filter(low_user=low_user, high_user=high_user)
+
+    def involving(self, user: User) -> FriendshipQuerySet:
+        return self.filter(Q(low_user=user) | Q(high_user=user))
+
+    def other_user_ids(self, user: User) -> QuerySet[Friendship, dict[str, Any]]:
+        return self.annotate(
+            other_user=Case(
+                When(low_user=user, then=F("high_user")), default=F("low_user")
+            )
+        ).values("other_user")
 
 
 class Friendship(models.Model):
@@ -24,9 +44,79 @@ class Friendship(models.Model):
     blocked_by = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="blocked_friendships", null=True
     )
+    low_user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="low_friendships"
+    )
+    high_user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="high_friendships"
+    )
+    objects = FriendshipQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["low_user", "high_user"], name="friendships_unique_pair"
+            ),
+        ]
+
+    @staticmethod
+    def ordered_pair(user_id: int, other_id: int) -> tuple[int, int]:
+        return (user_id, other_id) if user_id < other_id else (other_id, user_id)
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        self.low_user_id, self.high_user_id = self.ordered_pair(
+            self.user_id, self.friend_id
+        )
+        super().save(*args, **kwargs)
+
+
+class FriendEdge(models.Model):
+    status = models.CharField(
+        max_length=30, choices=Friendship.FriendshipStatus.choices
+    )
+    created_at = models.DateTimeField()
+    owner = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="friend_edges"
+    )
+    friend = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    friendship = models.ForeignKey(
+        Friendship, on_delete=models.CASCADE, related_name="edges"
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["owner", "friend"], name="friendships_unique_edge"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["owner", "status", "-created_at", "-id"],
+                name="friendships_edge_owner_status",
+            ),
+        ]
+
+
+class FriendSuggestion(models.Model):
+    mutual_friends = models.PositiveIntegerField()
+    computed_at = models.DateTimeField(auto_now_add=True)
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="friend_suggestions"
+    )
+    suggested_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
 
     class Meta:
-        unique_together = (("user", "friend"),)
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "suggested_user"], name="friendships_unique_suggestion"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["user", "-mutual_friends", "suggested_user"],
+                name="friendships_suggestion_rank",
+            ),
+        ]
 
 
 class FriendRequest(models.Model):
@@ -0,0 +1,35 @@
+from django.contrib.auth.models import User
+from django.db import connections
+from django.db.models import BooleanField, Case, Q, QuerySet, Value, When
+from django.db.models.functions import Upper
+
+
+def search_users(queryset: QuerySet[User], query: str) -> QuerySet[User]:
+    query = query.strip()
+    if not query:
+        return queryset.order_by("username")
+
+    queryset = queryset.annotate(
+        is_prefix=Case(
+            When(username__istartswith=query, then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        )
+    )
+
+    if connections[queryset.db].vendor != "postgresql":
+        return queryset.filter(username__icontains=query).order_by(
+            "-is_prefix", "username"
+        )
+
+    from django.contrib.postgres.search import TrigramSimilarity
+
+    # Both predicates are answered by the GIN index on UPPER(username), the
+    # trigram one also catches typos. Prefix matches rank first, then the
+    # closest usernames.
+    return (
+        queryset.alias(username_upper=Upper("username"))
+        .filter(Q(username__icontains=query) | Q(username_upper__trigram_similar=query))
+        .annotate(similarity=TrigramSimilarity("username_upper", query.upper()))
+        .order_by("-is_prefix", "-similarity", "username")
+    )
@@ -0,0 +1,77 @@
+import numpy as np
+import numpy.typing as npt
+from django.db import transaction
+from scipy import sparse
+
+from .models import FriendEdge, Friendship, FriendSuggestion
+
+DEFAULT_TOP_K = 20
+
+
+def _adjacency(
+    owners: npt.NDArray[np.int64], friends: npt.NDArray[np.int64], size: int
+) -> sparse.csr_matrix:
+    return sparse.csr_matrix(
+        (np.ones(len(owners), dtype=np.int32), (owners, friends)), shape=(size, size)
+    )
+
+
+def compute_suggestions(top_k: int = DEFAULT_TOP_K, batch_size: int = 1000) -> int:
+    FriendSuggestion.objects.exclude(
+        user__in=FriendEdge.objects.filter(
+            status=Friendship.FriendshipStatus.ACTIVE
+        ).values("owner")
+    ).delete()
+
+    edges = np.array(
+        FriendEdge.objects.exclude(
+            status=Friendship.FriendshipStatus.KICKED
+        ).values_list("owner_id", "friend_id", "status"),
+        dtype=object,
+    ).reshape(-1, 3)
+
+    user_ids, indices = np.unique(edges[:, :2].astype(np.int64), return_inverse=True)
+    indices = indices.reshape(-1, 2)
+    active = edges[:, 2] == Friendship.FriendshipStatus.ACTIVE
+
+    # friends[i, j] is set when i and j are friends, so friends @ friends counts
+    # the mutual friends of every pair. Existing friends and blocked users on
+    # either side are never suggested.
+    friends = _adjacency(indices[active, 0], indices[active, 1], len(user_ids))
+    related = _adjacency(indices[:, 0], indices[:, 1], len(user_ids))
+
+    created = 0
+    for start in range(0, len(user_ids), batch_size):
+        stop = min(start + batch_size, len(user_ids))
+        mutuals = (friends[start:stop] @ friends).tocsr()
+
+        suggestions: list[FriendSuggestion] = []
+        for row in range(stop - start):
+            user = start + row
+            candidates = mutuals.indices[mutuals.indptr[row] : mutuals.indptr[row + 1]]
+            counts = mutuals.data[mutuals.indptr[row] : mutuals.indptr[row + 1]]
+
+            excluded = related.indices[related.indptr[user] : related.indptr[user + 1]]
+            keep = (candidates != user) & ~np.isin(candidates, excluded)
+            candidates, counts = candidates[keep], counts[keep]
+
+            if len(candidates) > top_k:
+                best = np.argpartition(-counts, top_k - 1)[:top_k]
+                candidates, counts = candidates[best], counts[best]
+
+            suggestions.extend(
+                FriendSuggestion(
+                    user_id=int(user_ids[user]),
+                    suggested_user_id=int(user_ids[candidate]),
+                    mutual_friends=int(count),
+                )
+                for candidate, count in zip(candidates, counts)
+            )
+
+        with transaction.atomic():
+            FriendSuggestion.objects.filter(
+                user__in=user_ids[start:stop].tolist()
+            ).delete()
+            created += len(FriendSuggestion.objects.bulk_create(suggestions))
+
+    return created
@@ -1,3 +1,65 @@
+from django.contrib.auth.models import User
 from django.test import TestCase
 
-# Create your tests here.
+from friendships.edges import sync_edges
+from friendships.models import Friendship, FriendSuggestion
+from friendships.suggestions import compute_suggestions
+
+
+class ComputeSuggestionsTests(TestCase):
+    users: dict[str, User]
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.users = {name: User.objects.create(username=name) for name in "abcdex"}
+        friendships = [
+            cls._friendship(pair[0], pair[1])
+            for pair in ["ab", "ac", "ax", "bd", "be", "bx", "cd", "ce"]
+        ]
+        friendships.append(
+            cls._friendship("a", "e", Friendship.FriendshipStatus.BLOCKED)
+        )
+        sync_edges(friendships)
+
+    @classmethod
+    def _friendship(
+        cls,
+        user: str,
+        friend: str,
+        status: str = Friendship.FriendshipStatus.ACTIVE,
+    ) -> Friendship:
+        return Friendship.objects.create(
+            user=cls.users[user],
+            friend=cls.users[friend],
+            status=status,
+            blocked_by=(
+                cls.users[user]
+                if status == Friendship.FriendshipStatus.BLOCKED
+                else None
+            ),
+        )
+
+    def _suggestions(self, name: str) -> dict[str, int]:
+        return dict(
+            FriendSuggestion.objects.filter(user=self.users[name]).values_list(
+                "suggested_user__username", "mutual_friends"
+            )
+        )
+
+    def test_counts_mutual_friends(self) -> None:
+        compute_suggestions()
+
+        self.assertEqual(self._suggestions("b"), {"c": 3})
+        self.assertEqual(self._suggestions("d"), {"a": 2, "e": 2, "x": 1})
+
+    def test_excludes_friends_and_blocked_users(self) -> None:
+        compute_suggestions()
+
+        # b and x are friends of a, e is blocked by a, only d is left.
+        self.assertEqual(self._suggestions("a"), {"d": 2})
+        self.assertEqual(self._suggestions("e"), {"d": 2, "x": 1})
+
+    def test_keeps_the_top_k(self) -> None:
+        compute_suggestions(top_k=1)
+
+        self.assertEqual(self._suggestions("e"), {"d": 2})
@@ -15,6 +15,7 @@ from .views import (
     FriendUnblockView,
     FriendBlockedByListView,
     FriendRequestCancelView,
+    FriendSuggestionListView,
 )
 
 urlpatterns = [
@@ -54,6 +55,7 @@ urlpatterns = [
     path(
         "blocked_by/", FriendBlockedByListView.as_view(), name="friend_blocked_by_list"
     ),
+    path("suggestions/", FriendSuggestionListView.as_view(), name="friend_suggestions"),
     path("search/", FriendSearchView.as_view(), name="friend_search"),
     path(
         "search/<int:pk>", FriendSendRequestView.as_view(), name="friend_send_request"
@@ -3,7 +3,7 @@ from typing import Any, cast
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib import messages
 from django.db import transaction
-from django.db.models import Exists, Q, OuterRef, F, QuerySet
+from django.db.models import Exists, Q, OuterRef, QuerySet
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
@@ -13,32 +13,43 @@ from django.views.generic import ListView, CreateView, TemplateView
 
 from django.contrib.auth.models import User
 
+from .edges import sync_edges
 from .forms import FriendRequestForm
-from .models import Friendship, FriendRequest
+from .graph import get_relations, invalidate_relations
+from .models import FriendEdge, Friendship, FriendRequest, FriendSuggestion
+from .search import search_users
+from common.pagination import KeysetPaginationMixin
+from notifications.counters import reset_unread_count
 from notifications.models import Notification
+from notifications.services import notify
 
 
 class FriendDashboardView(LoginRequiredMixin, TemplateView):
     template_name = "friendships/friend_dashboard.html"
 
 
-class FriendListView(LoginRequiredMixin, ListView):
-    model = User
+class FriendListView(LoginRequiredMixin, KeysetPaginationMixin, ListView):
+    model = FriendEdge
     template_name = "friendships/friend_list.html"
     context_object_name = "friends"
-    paginate_by = 10
+    keyset_field = "created_at"
 
-    def get_queryset(self) -> QuerySet[User]:
-        return self.model.objects.filter(
-            Q(
-                sent_friendships__friend=self.request.user,
-                sent_friendships__status=Friendship.FriendshipStatus.ACTIVE,
-            )
-            | Q(
-                accepted_friendships__user=self.request.user,
-                accepted_friendships__status=Friendship.FriendshipStatus.ACTIVE,
-            )
-        ).distinct()
+    def get_queryset(self) -> QuerySet[FriendEdge]:
+        user = cast(User, self.request.user)
+        queryset = self.model.objects.filter(
+            owner=user, status=Friendship.FriendshipStatus.ACTIVE
+        ).select_related("friend__profile")
+        # Friends are read from the user's own edges, newest friendship first,
+        # walking the (owner, status, -created_at, -id) index.
+        return self.paginate_keyset(queryset)
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        edges, cursors = self.get_keyset_page(self.object_list)
+        context = super().get_context_data(
+            object_list=[edge.friend for edge in edges], **kwargs
+        )
+        context.update(cursors)
+        return context
 
 
 class FriendKickView(LoginRequiredMixin, View):
@@ -47,22 +58,25 @@ class FriendKickView(LoginRequiredMixin, View):
         user = cast(User, request.user)
 
         friend = get_object_or_404(User, pk=pk)
-        friendship = Friendship.objects.filter(
-            Q(status=Friendship.FriendshipStatus.ACTIVE),
-            Q(user=user, friend=friend) | Q(user=friend, friend=user),
-        ).first()
+
+        friendship = (
+            Friendship.objects.between(user, friend)
+            .filter(status=Friendship.FriendshipStatus.ACTIVE)
+            .first()
+        )
 
         if not friendship:
             messages.error(request, "You can't kick this user!")
             return redirect("friend_list")
 
-        Friendship.objects.filter(pk=friendship.pk).update(
-            status=Friendship.FriendshipStatus.KICKED,
-            kicked_at=timezone.now(),
-            kicked_by=user,
-        )
+        friendship.status = Friendship.FriendshipStatus.KICKED
+        friendship.kicked_at = timezone.now()
+        friendship.kicked_by = user
+        friendship.save()
+        sync_edges([friendship])
+        invalidate_relations(user.pk, friend.pk)
 
-        Notification.objects.create(
+        notify(
             type=Notification.NotificationType.USER_KICK,
             user=friend,
             notification_user=user,
@@ -85,12 +99,10 @@ class FriendBlockView(LoginRequiredMixin, View):
             messages.error(request, "You can't block yourself!")
             return redirect("friend_list")
 
-        friendship = Friendship.objects.filter(
-            Q(user=user, friend=user_to_block) | Q(user=user_to_block, friend=user)
-        ).first()
+        friendship = Friendship.objects.between(user, user_to_block).first()
 
         if not friendship:
-            Friendship.objects.create(
+            friendship = Friendship.objects.create(
                 status=Friendship.FriendshipStatus.BLOCKED,
                 user=user,
                 friend=user_to_block,
@@ -106,13 +118,16 @@ class FriendBlockView(LoginRequiredMixin, View):
             friendship.blocked_by = user
             friendship.save()
 
+        sync_edges([friendship])
+        invalidate_relations(user.pk, user_to_block.pk)
+
         FriendRequest.objects.filter(
             Q(sender=user, receiver=user_to_block)
             | Q(sender=user_to_block, receiver=user),
             status=FriendRequest.RequestStatus.PENDING,
         ).update(status=FriendRequest.RequestStatus.DECLINED)
 
-        Notification.objects.create(
+        notify(
             type=Notification.NotificationType.USER_BLOCK,
             user=user_to_block,
             notification_user=user,
@@ -159,6 +174,7 @@ class FriendRequestCancelView(LoginRequiredMixin, View):
             notification_user=user,
             received_at=request_sent.sent_at,
         ).delete()
+        reset_unread_count(request_sent.receiver_id)
 
         messages.success(request, "You successfully cancelled request!")
         return redirect("friend_request_sent_list")
@@ -196,13 +212,12 @@ class FriendAcceptRequestView(LoginRequiredMixin, View):
         request_received.status = FriendRequest.RequestStatus.ACCEPTED
         request_received.save()
 
-        friendship = Friendship.objects.filter(
-            Q(user=request_received.sender, friend=request_received.receiver)
-            | Q(user=request_received.receiver, friend=request_received.sender)
+        friendship = Friendship.objects.between(
+            request_received.sender, request_received.receiver
         ).first()
 
         if not friendship:
-            Friendship.objects.create(
+            friendship = Friendship.objects.create(
                 status=Friendship.FriendshipStatus.ACTIVE,
                 user=request_received.sender,
                 friend=request_received.receiver,
@@ -218,7 +233,10 @@ class FriendAcceptRequestView(LoginRequiredMixin, View):
             friendship.blocked_by = None
             friendship.save()
 
-        Notification.objects.create(
+        sync_edges([friendship])
+        invalidate_relations(request_received.sender_id, user.pk)
+
+        notify(
             type=Notification.NotificationType.FRIEND_REQUEST_ACCEPTED,
             user=request_received.sender,
             notification_user=user,
@@ -243,7 +261,7 @@ class FriendDeclineRequestView(LoginRequiredMixin, View):
         request_received.status = FriendRequest.RequestStatus.DECLINED
         request_received.save()
 
-        Notification.objects.create(
+        notify(
             type=Notification.NotificationType.FRIEND_REQUEST_DECLINED,
             user=request_received.sender,
             notification_user=user,
@@ -262,16 +280,11 @@ class FriendBlockedListView(LoginRequiredMixin, ListView):
     paginate_by = 10
 
     def get_queryset(self) -> QuerySet[User]:
+        user = cast(User, self.request.user)
+
         return self.model.objects.filter(
-            Q(
-                sent_friendships__friend=self.request.user,
-                sent_friendships__blocked_by=self.request.user,
-            )
-            | Q(
-                accepted_friendships__user=self.request.user,
-                accepted_friendships__blocked_by=self.request.user,
-            )
-        ).distinct()
+            pk__in=Friendship.objects.filter(blocked_by=user).other_user_ids(user)
+        ).order_by("username")
 
 
 class FriendUnblockView(LoginRequiredMixin, View):
@@ -279,18 +292,18 @@ class FriendUnblockView(LoginRequiredMixin, View):
         user = cast(User, request.user)
 
         friend = get_object_or_404(User, pk=pk)
-        friendship = Friendship.objects.filter(
-            Q(user=user) & Q(friend=friend) & Q(blocked_by=user)
-            | Q(user=friend) & Q(friend=user) & Q(blocked_by=user)
-        ).first()
+        friendship = (
+            Friendship.objects.between(user, friend).filter(blocked_by=user).first()
+        )
 
         if not friendship:
             messages.error(request, "You can't unblock this user!")
             return redirect("friend_blocked_list")
 
         friendship.delete()
+        invalidate_relations(user.pk, friend.pk)
 
-        Notification.objects.create(
+        notify(
             type=Notification.NotificationType.USER_UNBLOCK,
             user=friend,
             notification_user=user,
@@ -307,16 +320,14 @@ class FriendBlockedByListView(LoginRequiredMixin, ListView):
     paginate_by = 10
 
     def get_queryset(self) -> QuerySet[User]:
+        user = cast(User, self.request.user)
+
         return self.model.objects.filter(
-            Q(
-                sent_friendships__friend=self.request.user,
-                sent_friendships__blocked_by=F("sent_friendships__user"),
-            )
-            | Q(
-                accepted_friendships__user=self.request.user,
-                accepted_friendships__blocked_by=F("accepted_friendships__friend"),
-            )
-        ).distinct()
+            pk__in=Friendship.objects.involving(user)
+            .filter(blocked_by__isnull=False)
+            .exclude(blocked_by=user)
+            .other_user_ids(user)
+        ).order_by("username")
 
 
 class FriendSearchView(LoginRequiredMixin, ListView):
@@ -328,54 +339,75 @@ class FriendSearchView(LoginRequiredMixin, ListView):
     def get_queryset(self) -> QuerySet[User]:
         user = cast(User, self.request.user)
 
-        queryset = (
-            self.model.objects.exclude(pk=user.pk)
+        return search_users(
+            self.model.objects.exclude(pk=user.pk).select_related("profile"),
+            self.request.GET.get("q", ""),
+        )
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        user = cast(User, self.request.user)
+        context = super().get_context_data(**kwargs)
+
+        # Relationship flags are only resolved for the rows of the current page.
+        users = list(context["users"])
+        page_ids = [user_item.pk for user_item in users]
+
+        relations = get_relations(user.pk)
+        requests = FriendRequest.objects.filter(
+            Q(sender=user, receiver__in=page_ids)
+            | Q(sender__in=page_ids, receiver=user),
+            status=FriendRequest.RequestStatus.PENDING,
+        ).values_list("sender_id", "receiver_id")
+        requests_sent_to: set[int] = set()
+        requests_sent_from: set[int] = set()
+        for sender_id, receiver_id in requests:
+            if sender_id == user.pk:
+                requests_sent_to.add(receiver_id)
+            else:
+                requests_sent_from.add(sender_id)
+
+        for user_item in users:
+            user_item.is_friend = user_item.pk in relations.friends
+            user_item.blocked = user_item.pk in relations.blocked
+            user_item.blocked_by = user_item.pk in relations.blocked_by
+            user_item.request_sent_to = user_item.pk in requests_sent_to
+            user_item.request_sent_from = user_item.pk in requests_sent_from
+
+        context["users"] = context["object_list"] = users
+        return context
+
+
+class FriendSuggestionListView(LoginRequiredMixin, ListView):
+    model = FriendSuggestion
+    template_name = "friendships/friend_suggestions.html"
+    context_object_name = "suggestions"
+
+    def get_queryset(self) -> QuerySet[FriendSuggestion]:
+        user = cast(User, self.request.user)
+        relations = get_relations(user.pk)
+
+        # Suggestions are precomputed by friendships_compute_suggestions, only
+        # drop the ones made stale by relationships created since the last run.
+        return (
+            self.model.objects.filter(user=user)
+            .exclude(
+                suggested_user__in=relations.friends
+                | relations.blocked
+                | relations.blocked_by
+            )
             .annotate(
-                is_friend=Exists(
-                    Friendship.objects.filter(
-                        Q(status=Friendship.FriendshipStatus.ACTIVE),
-                        Q(user=user, friend=OuterRef("pk"))
-                        | Q(user=OuterRef("pk"), friend=user),
-                    )
-                ),
-                request_sent_to=Exists(
+                has_request=Exists(
                     FriendRequest.objects.filter(
+                        Q(sender=user, receiver=OuterRef("suggested_user"))
+                        | Q(sender=OuterRef("suggested_user"), receiver=user),
                         status=FriendRequest.RequestStatus.PENDING,
-                        sender=user,
-                        receiver=OuterRef("pk"),
-                    )
-                ),
-                request_sent_from=Exists(
-                    FriendRequest.objects.filter(
-                        status=FriendRequest.RequestStatus.PENDING,
-                        sender=OuterRef("pk"),
-                        receiver=user,
-                    )
-                ),
-                blocked=Exists(
-                    Friendship.objects.filter(
-                        Q(blocked_by=user),
-                        Q(user=user, friend=OuterRef("pk"))
-                        | Q(user=OuterRef("pk"), friend=user),
-                    )
-                ),
-                blocked_by=Exists(
-                    Friendship.objects.filter(
-                        Q(blocked_by=OuterRef("pk")),
-                        Q(user=user, friend=OuterRef("pk"))
-                        | Q(user=OuterRef("pk"), friend=user),
                     )
-                ),
+                )
             )
-            .distinct()
+            .select_related("suggested_user__profile")
+            .order_by("-mutual_friends", "suggested_user")
         )
 
-        search_query = self.request.GET.get("q")
-        if search_query:
-            queryset = queryset.filter(Q(username__icontains=search_query))
-
-        return queryset
-
 
 class FriendSendRequestView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
     form_class = FriendRequestForm
@@ -394,15 +426,11 @@ class FriendSendRequestView(LoginRequiredMixin, UserPassesTestMixin, CreateView)
 
         is_user = user == self.friend
 
-        has_friendship = Friendship.objects.filter(
-            Q(
-                status__in=[
-                    Friendship.FriendshipStatus.BLOCKED,
-                    Friendship.FriendshipStatus.ACTIVE,
-                ]
-            ),
-            Q(user=user, friend=self.friend) | Q(user=self.friend, friend=user),
-        ).exists()
+        has_friendship = (
+            Friendship.objects.between(user, self.friend)
+            .exclude(status=Friendship.FriendshipStatus.KICKED)
+            .exists()
+        )
 
         has_request = FriendRequest.objects.filter(
             Q(status=FriendRequest.RequestStatus.PENDING),
@@ -420,6 +448,7 @@ class FriendSendRequestView(LoginRequiredMixin, UserPassesTestMixin, CreateView)
         context["friend"] = self.friend
         return context
 
+    @transaction.atomic
     def form_valid(self, form: FriendRequestForm) -> HttpResponse:
         user = cast(User, self.request.user)
 
@@ -427,7 +456,9 @@ class FriendSendRequestView(LoginRequiredMixin, UserPassesTestMixin, CreateView)
         form.instance.sender = user
         form.instance.receiver = self.friend
 
-        Notification.objects.create(
+        response = super().form_valid(form)
+
+        notify(
             type=Notification.NotificationType.FRIEND_REQUEST_RECEIVED,
             user=self.friend,
             notification_user=user,
@@ -437,4 +468,4 @@ class FriendSendRequestView(LoginRequiredMixin, UserPassesTestMixin, CreateView)
             self.request, f"Friend request sent to {self.friend.username}!"
         )
 
-        return super().form_valid(form)
+        return response
@@ -0,0 +1,136 @@
+from collections import Counter
+from collections.abc import Iterable, Mapping
+
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+
+from groups.models import Group, GroupAddRequest, GroupMembership
+
+
+def update_counters(group_id: int, **deltas: int) -> None:
+    changes = {field: F(field) + delta for field, delta in deltas.items() if delta}
+    if changes:
+        Group.objects.filter(pk=group_id).update(**changes)
+
+
+def update_many_counters(deltas: Mapping[int, Mapping[str, int]]) -> None:
+    # One UPDATE for every group, each field adds its per-group delta.
+    fields = {
+        field
+        for changes in deltas.values()
+        for field, delta in changes.items()
+        if delta
+    }
+    if not fields:
+        return
+
+    Group.objects.filter(pk__in=deltas).update(
+        **{
+            field: F(field)
+            + Case(
+                *[
+                    When(pk=group_id, then=Value(changes[field]))
+                    for group_id, changes in deltas.items()
+                    if changes.get(field)
+                ],
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+            for field in fields
+        }
+    )
+
+
+def membership_deltas(old_status: str | None, new_status: str | None) -> Counter[str]:
+    # A status of None means the membership row doesn't exist (anymore).
+    accepted = GroupMembership.MembershipStatus.ACCEPTED
+    blocked = GroupMembership.MembershipStatus.BLOCKED
+    return Counter(
+        member_count=(new_status == accepted) - (old_status == accepted),
+        blocked_count=(new_status == blocked) - (old_status == blocked),
+    )
+
+
+def membership_changed(
+    group_id: int, old_status: str | None, new_status: str | None
+) -> None:
+    update_counters(group_id, **membership_deltas(old_status, new_status))
+
+
+def _count(queryset: QuerySet) -> Coalesce:
+    return Coalesce(
+        Subquery(
+            queryset.filter(group=OuterRef("pk"))
+            .order_by()
+            .values("group")
+            .annotate(count=Count("pk"))
+            .values("count"),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def reconcile_counters(
+    group_ids: Iterable[int] | None = None, batch_size: int = 1000
+) -> int:
+    groups = Group.objects.all()
+    if group_ids is not None:
+        groups = groups.filter(pk__in=group_ids)
+
+    rows = groups.annotate(
+        actual_members=_count(
+            GroupMembership.objects.filter(
+                status=GroupMembership.MembershipStatus.ACCEPTED
+            )
+        ),
+        actual_pending_requests=_count(
+            GroupAddRequest.objects.filter(status=GroupAddRequest.RequestStatus.PENDING)
+        ),
+        actual_blocked=_count(
+            GroupMembership.objects.filter(
+                status=GroupMembership.MembershipStatus.BLOCKED
+            )
+        ),
+    ).values_list(
+        "pk",
+        "member_count",
+        "pending_requests_count",
+        "blocked_count",
+        "actual_members",
+        "actual_pending_requests",
+        "actual_blocked",
+    )
+
+    reconciled = 0
+    batch: list[Group] = []
+    for pk, *stored, members, pending_requests, blocked in rows.iterator(
+        chunk_size=batch_size
+    ):
+        if stored == [members, pending_requests, blocked]:
+            continue
+
+        batch.append(
+            Group(
+                pk=pk,
+                member_count=members,
+                pending_requests_count=pending_requests,
+                blocked_count=blocked,
+            )
+        )
+
+        if len(batch) >= batch_size:
+            reconciled += Group.objects.bulk_update(batch, Group.COUNTER_FIELDS)
+            batch = []
+
+    return reconciled + Group.objects.bulk_update(batch, Group.COUNTER_FIELDS)
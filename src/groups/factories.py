@@ -4,6 +4,7 @@ from faker import Faker
 import random
 
 from django.contrib.auth.models import User
+from .counters import membership_changed
 from .models import Group, GroupAddRequest, GroupMembership
 from accounts.factories import UserFactory
 
@@ -36,6 +37,7 @@ class GroupFactoryExistingAdmin(GroupFactory):
         GroupMembershipFactory.create(
             status="accepted", user=self.admin_user, group=self
         )
+        membership_changed(self.pk, None, "accepted")
 
 
 class GroupAddRequestFactory(factory.django.DjangoModelFactory):
@@ -1,36 +1,92 @@
+from argparse import ArgumentParser
+from collections import Counter, defaultdict
 from typing import Any
 
 from django.core.management import BaseCommand
 from django.db import transaction
 
+from groups.counters import membership_deltas, update_many_counters
 from groups.models import GroupAddRequest, GroupMembership
+from groups.services import add_members_rankings
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+
     def handle(self, *args: Any, **options: Any) -> None:
-        self.stdout.write("Accepting request(s)...")
+        batch_size = options["batch_size"]
+        total = GroupAddRequest.objects.filter(
+            status=GroupAddRequest.RequestStatus.PENDING
+        ).count()
+
+        self.stdout.write(f"Accepting {total} request(s)...")
 
-        self._accept_requests()
+        accepted = 0
+        last_pk = 0
+        while True:
+            nb_requests, last_pk = self._accept_requests(last_pk, batch_size)
+            if not nb_requests:
+                break
+
+            accepted += nb_requests
+            self.stdout.write(f"Accepted {accepted}/{total} request(s)")
 
         self.stdout.write("Successfully accepted all requests!")
 
     @transaction.atomic
-    def _accept_requests(self) -> None:
-        join_requests = GroupAddRequest.objects.filter(
-            status=GroupAddRequest.RequestStatus.PENDING
+    def _accept_requests(self, last_pk: int, batch_size: int) -> tuple[int, int]:
+        join_requests = list(
+            GroupAddRequest.objects.select_for_update()
+            .filter(status=GroupAddRequest.RequestStatus.PENDING, pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", "user_id", "group_id")[:batch_size]
         )
+        if not join_requests:
+            return 0, last_pk
+
+        GroupAddRequest.objects.filter(
+            pk__in=[pk for pk, _, _ in join_requests]
+        ).update(status=GroupAddRequest.RequestStatus.ACCEPTED)
 
-        for join_request in join_requests:
-            join_request.status = GroupAddRequest.RequestStatus.ACCEPTED
-            join_request.save()
+        deltas: dict[int, Counter[str]] = defaultdict(Counter)
+        pairs: set[tuple[int, int]] = set()
+        for _, user_id, group_id in join_requests:
+            deltas[group_id]["pending_requests_count"] -= 1
+            pairs.add((user_id, group_id))
 
-            membership, created = GroupMembership.objects.get_or_create(
-                user=join_request.user,
-                group=join_request.group,
-                defaults={"status": GroupMembership.MembershipStatus.ACCEPTED},
+        previous_statuses = {
+            (user_id, group_id): status
+            for user_id, group_id, status in GroupMembership.objects.filter(
+                user__in={user_id for user_id, _ in pairs},
+                group__in={group_id for _, group_id in pairs},
+            ).values_list("user_id", "group_id", "status")
+            if (user_id, group_id) in pairs
+        }
+
+        GroupMembership.objects.bulk_create(
+            [
+                GroupMembership(
+                    status=GroupMembership.MembershipStatus.ACCEPTED,
+                    user_id=user_id,
+                    group_id=group_id,
+                )
+                for user_id, group_id in pairs
+            ],
+            update_conflicts=True,
+            unique_fields=["user", "group"],
+            update_fields=["status", "kicked_at", "blocked_at"],
+        )
+
+        for user_id, group_id in pairs:
+            deltas[group_id].update(
+                membership_deltas(
+                    previous_statuses.get((user_id, group_id)),
+                    GroupMembership.MembershipStatus.ACCEPTED,
+                )
             )
-            if not created:
-                membership.status = GroupMembership.MembershipStatus.ACCEPTED
-                membership.kicked_at = None
-                membership.blocked_at = None
-                membership.save()
+        update_many_counters(deltas)
+
+        add_members_rankings(pairs)
+
+        return len(join_requests), join_requests[-1][0]
@@ -1,19 +1,60 @@
+from argparse import ArgumentParser
+from collections import Counter
 from typing import Any
 
 from django.core.management import BaseCommand
+from django.db import transaction
 
-from groups.models import GroupAddRequest, GroupMembership
+from groups.counters import update_many_counters
+from groups.models import GroupAddRequest
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+
     def handle(self, *args: Any, **options: Any) -> None:
-        self.stdout.write("Declining request(s)...")
+        batch_size = options["batch_size"]
+        total = GroupAddRequest.objects.filter(
+            status=GroupAddRequest.RequestStatus.PENDING
+        ).count()
+
+        self.stdout.write(f"Declining {total} request(s)...")
+
+        declined = 0
+        last_pk = 0
+        while True:
+            nb_requests, last_pk = self._decline_requests(last_pk, batch_size)
+            if not nb_requests:
+                break
 
-        self._decline_requests()
+            declined += nb_requests
+            self.stdout.write(f"Declined {declined}/{total} request(s)")
 
         self.stdout.write("Successfully declined all requests!")
 
-    def _decline_requests(self) -> None:
-        GroupAddRequest.objects.filter(
-            status=GroupAddRequest.RequestStatus.PENDING
-        ).update(status=GroupAddRequest.RequestStatus.DECLINED)
+    @transaction.atomic
+    def _decline_requests(self, last_pk: int, batch_size: int) -> tuple[int, int]:
+        join_requests = list(
+            GroupAddRequest.objects.select_for_update()
+            .filter(status=GroupAddRequest.RequestStatus.PENDING, pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", "group_id")[:batch_size]
+        )
+        if not join_requests:
+            return 0, last_pk
+
+        GroupAddRequest.objects.filter(pk__in=[pk for pk, _ in join_requests]).update(
+            status=GroupAddRequest.RequestStatus.DECLINED
+        )
+
+        update_many_counters(
+            {
+                group_id: {"pending_requests_count": -count}
+                for group_id, count in Counter(
+                    group_id for _, group_id in join_requests
+                ).items()
+            }
+        )
+
+        return len(join_requests), join_requests[-1][0]
@@ -1,16 +1,35 @@
+from argparse import ArgumentParser
 from typing import Any
 
 from django.core.management import BaseCommand
+from django.db import transaction
+
 from groups.models import Group
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+
     def handle(self, *args: Any, **options: Any) -> None:
-        self.stdout.write("Deleting all groups...")
+        batch_size = options["batch_size"]
+        total = Group.objects.count()
+
+        self.stdout.write(f"Deleting {total} group(s)...")
 
-        self._delete_groups()
+        deleted = 0
+        while nb_groups := self._delete_groups(batch_size):
+            deleted += nb_groups
+            self.stdout.write(f"Deleted {deleted}/{total} group(s)")
 
         self.stdout.write("Successfully deleted all groups!")
 
-    def _delete_groups(self) -> None:
-        Group.objects.all().delete()
+    @transaction.atomic
+    def _delete_groups(self, batch_size: int) -> int:
+        # Memberships, requests, rankings and notifications have no dependents
+        # of their own, so the collector removes them with one DELETE per table.
+        group_ids = list(
+            Group.objects.order_by("pk").values_list("pk", flat=True)[:batch_size]
+        )
+        Group.objects.filter(pk__in=group_ids).delete()
+        return len(group_ids)
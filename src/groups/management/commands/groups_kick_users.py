@@ -1,10 +1,12 @@
 from typing import Any
 
 from django.core.management import BaseCommand
+from django.db import transaction
 from django.db.models import F
 from django.utils import timezone
 
-from groups.models import GroupMembership
+from groups.counters import reconcile_counters
+from groups.models import GroupMembership, GroupRanking
 
 
 class Command(BaseCommand):
@@ -15,9 +17,15 @@ class Command(BaseCommand):
 
         self.stdout.write("Successfully kicked all users!")
 
+    @transaction.atomic
     def _kick_users(self) -> None:
-        GroupMembership.objects.filter(
+        memberships = GroupMembership.objects.filter(
             status=GroupMembership.MembershipStatus.ACCEPTED
-        ).exclude(user=F("group__admin_user")).update(
+        ).exclude(user=F("group__admin_user"))
+        group_ids = set(memberships.values_list("group", flat=True))
+
+        memberships.update(
             status=GroupMembership.MembershipStatus.KICKED, kicked_at=timezone.now()
         )
+        reconcile_counters(group_ids)
+        GroupRanking.objects.exclude(user=F("group__admin_user")).delete()
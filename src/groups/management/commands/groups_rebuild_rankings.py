@@ -0,0 +1,23 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from groups.services import rebuild_rankings
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.stdout.write("Rebuilding group rankings...")
+
+        nb_rankings = self._rebuild_rankings(options["batch_size"])
+
+        self.stdout.write(f"Successfully rebuilt {nb_rankings} ranking entries!")
+
+    @transaction.atomic
+    def _rebuild_rankings(self, batch_size: int) -> int:
+        return rebuild_rankings(batch_size)
@@ -0,0 +1,18 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management import BaseCommand
+
+from groups.counters import reconcile_counters
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.stdout.write("Reconciling group counters...")
+
+        nb_groups = reconcile_counters(batch_size=options["batch_size"])
+
+        self.stdout.write(f"Successfully repaired {nb_groups} group(s)!")
@@ -1,26 +1,80 @@
+import random
 from argparse import ArgumentParser
+from collections import Counter, defaultdict
 from typing import Any
 
 from django.core.management import BaseCommand
 from django.contrib.auth.models import User
+from django.db import transaction
+from faker import Faker
 
-from groups.factories import GroupSendRequestFactory
+from groups.counters import update_many_counters
+from groups.models import Group, GroupAddRequest
+
+fake = Faker()
 
 
 class Command(BaseCommand):
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("count", type=int, default=1)
+        parser.add_argument("--batch-size", type=int, default=1000)
 
     def handle(self, *args: Any, **options: Any) -> None:
         count = options["count"]
-        users = User.objects.all()
+        users_per_batch = max(options["batch_size"] // max(count, 1), 1)
+
+        group_ids: list[int] = []
+        hosted_groups: dict[int, set[int]] = defaultdict(set)
+        for group_id, admin_user_id in Group.objects.values_list("pk", "admin_user"):
+            group_ids.append(group_id)
+            hosted_groups[admin_user_id].add(group_id)
+
+        user_ids = list(User.objects.order_by("pk").values_list("pk", flat=True))
 
         self.stdout.write(f"Sending {count} request(s) from each user...")
 
-        for user in users:
-            self._send_requests(count, user)
+        for start in range(0, len(user_ids), users_per_batch):
+            batch = user_ids[start : start + users_per_batch]
+            self._send_requests(count, batch, group_ids, hosted_groups)
+            self.stdout.write(
+                f"Sent requests from {start + len(batch)}/{len(user_ids)} user(s)"
+            )
 
         self.stdout.write(f"Successfully sent {count} request(s) from each user!")
 
-    def _send_requests(self, count: int, user: User) -> None:
-        GroupSendRequestFactory.create_batch(count, user=user)
+    @transaction.atomic
+    def _send_requests(
+        self,
+        count: int,
+        user_ids: list[int],
+        group_ids: list[int],
+        hosted_groups: dict[int, set[int]],
+    ) -> None:
+        join_requests: list[GroupAddRequest] = []
+        for user_id in user_ids:
+            hosted = hosted_groups[user_id]
+            # Over-sample by the number of hosted groups so that enough
+            # candidates remain once the user's own groups are dropped.
+            candidates = random.sample(
+                group_ids, min(count + len(hosted), len(group_ids))
+            )
+            join_requests.extend(
+                GroupAddRequest(
+                    message=fake.text(max_nb_chars=500),
+                    status=GroupAddRequest.RequestStatus.PENDING,
+                    user_id=user_id,
+                    group_id=group_id,
+                )
+                for group_id in [pk for pk in candidates if pk not in hosted][:count]
+            )
+
+        GroupAddRequest.objects.bulk_create(join_requests)
+
+        update_many_counters(
+            {
+                group_id: {"pending_requests_count": nb_requests}
+                for group_id, nb_requests in Counter(
+                    join_request.group_id for join_request in join_requests
+                ).items()
+            }
+        )
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exercises", "0002_alter_exercise_description_and_more"),
+        ("groups", "0005_alter_groupaddrequest_unique_together"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GroupRanking",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("estimated_max", models.DecimalField(decimal_places=1, max_digits=4)),
+                ("achieved_at", models.DateTimeField()),
+                (
+                    "exercise",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="group_rankings",
+                        to="exercises.exercise",
+                    ),
+                ),
+                (
+                    "group",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_rankings",
+                        to="groups.group",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="group_rankings",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["group", "exercise", "-estimated_max"],
+                        name="groups_ranking_leaderboard",
+                    )
+                ],
+                "unique_together": {("group", "exercise", "user")},
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exercises", "0002_alter_exercise_description_and_more"),
+        ("groups", "0006_groupranking"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="groupranking",
+            name="relative_score",
+            field=models.DecimalField(decimal_places=2, max_digits=6, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="groupranking",
+            index=models.Index(
+                fields=["group", "exercise", "-relative_score"],
+                name="groups_ranking_relative",
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.db import migrations
+
+INDEX_NAME = "groups_group_search"
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON groups_group USING gin (("
+        "setweight(to_tsvector('english'::regconfig, COALESCE(name, '')), 'A') || "
+        "setweight(to_tsvector('english'::regconfig, COALESCE(description, '')), 'B')"
+        "))"
+    )
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("groups", "0007_groupranking_relative_score"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:53
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset):
+    return Coalesce(
+        Subquery(
+            queryset.filter(group=OuterRef("pk"))
+            .order_by()
+            .values("group")
+            .annotate(count=Count("pk"))
+            .values("count"),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def populate_counters(apps, schema_editor):
+    Group = apps.get_model("groups", "Group")
+    GroupAddRequest = apps.get_model("groups", "GroupAddRequest")
+    GroupMembership = apps.get_model("groups", "GroupMembership")
+
+    Group.objects.update(
+        member_count=_count(GroupMembership.objects.filter(status="accepted")),
+        pending_requests_count=_count(GroupAddRequest.objects.filter(status="pending")),
+        blocked_count=_count(GroupMembership.objects.filter(status="blocked")),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("groups", "0008_group_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="group",
+            name="blocked_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="group",
+            name="member_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="group",
+            name="pending_requests_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -2,19 +2,9 @@ from __future__ import annotations
 
 from django.db import models
 from django.contrib.auth.models import User
-from django.db.models import Count, Q, QuerySet
+from typing import Any
 
-
-class GroupManager(models.Manager):
-    def with_member_count(self) -> QuerySet[Group]:
-        return self.get_queryset().annotate(  # type: ignore[no-any-return]
-            member_count=Count(
-                "user_memberships",
-                filter=Q(
-                    user_memberships__status=GroupMembership.MembershipStatus.ACCEPTED
-                ),
-            )
-        )
+from exercises.models import Exercise
 
 
 class Group(models.Model):
@@ -25,11 +15,26 @@ class Group(models.Model):
     admin_user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="groups_hosted"
     )
-    objects = GroupManager()
+    # Maintained with F() updates by groups.counters, never through save().
+    member_count = models.PositiveIntegerField(default=0)
+    pending_requests_count = models.PositiveIntegerField(default=0)
+    blocked_count = models.PositiveIntegerField(default=0)
+
+    COUNTER_FIELDS = ("member_count", "pending_requests_count", "blocked_count")
 
     def __str__(self) -> str:
         return f"{self.name}"
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        # A stale instance must not overwrite counters moved since it was read.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
 
 class GroupAddRequest(models.Model):
     class RequestStatus(models.TextChoices):
@@ -71,3 +76,31 @@ class GroupMembership(models.Model):
 
     class Meta:
         unique_together = (("user", "group"),)
+
+
+class GroupRanking(models.Model):
+    estimated_max = models.DecimalField(max_digits=4, decimal_places=1)
+    relative_score = models.DecimalField(max_digits=6, decimal_places=2, null=True)
+    achieved_at = models.DateTimeField()
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="group_rankings"
+    )
+    group = models.ForeignKey(
+        Group, on_delete=models.CASCADE, related_name="user_rankings"
+    )
+    exercise = models.ForeignKey(
+        Exercise, on_delete=models.CASCADE, related_name="group_rankings"
+    )
+
+    class Meta:
+        unique_together = (("group", "exercise", "user"),)
+        indexes = [
+            models.Index(
+                fields=["group", "exercise", "-estimated_max"],
+                name="groups_ranking_leaderboard",
+            ),
+            models.Index(
+                fields=["group", "exercise", "-relative_score"],
+                name="groups_ranking_relative",
+            ),
+        ]
@@ -0,0 +1,38 @@
+from django.contrib.auth.models import User
+from django.db import connections
+from django.db.models import Q, QuerySet
+
+from groups.models import Group
+
+SEARCH_CONFIG = "english"
+
+
+def search_groups(queryset: QuerySet[Group], query: str) -> QuerySet[Group]:
+    query = query.strip()
+    if not query:
+        return queryset.order_by("name", "pk")
+
+    admin_users = User.objects.filter(username__icontains=query).values("pk")
+
+    if connections[queryset.db].vendor != "postgresql":
+        return queryset.filter(
+            Q(name__icontains=query)
+            | Q(description__icontains=query)
+            | Q(admin_user__in=admin_users)
+        ).order_by("name", "pk")
+
+    from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+    # Must stay identical to the expression of the groups_group_search GIN
+    # index created in migration 0008, otherwise the index isn't used.
+    vector = SearchVector("name", weight="A", config=SEARCH_CONFIG) + SearchVector(
+        "description", weight="B", config=SEARCH_CONFIG
+    )
+    search_query = SearchQuery(query, search_type="websearch", config=SEARCH_CONFIG)
+
+    return (
+        queryset.alias(search=vector)
+        .filter(Q(search=search_query) | Q(admin_user__in=admin_users))
+        .annotate(rank=SearchRank(vector, search_query))
+        .order_by("-rank", "name", "pk")
+    )
@@ -0,0 +1,112 @@
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.contrib.auth.models import User
+from django.db.models import F
+
+from groups.models import Group, GroupMembership, GroupRanking
+from workout_performance.models import UserExercisePR
+
+
+def _upsert_rankings(rankings: Iterable[GroupRanking]) -> None:
+    GroupRanking.objects.bulk_create(
+        rankings,
+        update_conflicts=True,
+        unique_fields=["group", "exercise", "user"],
+        update_fields=["estimated_max", "relative_score", "achieved_at"],
+    )
+
+
+def _ranking_from_record(record: UserExercisePR, group_id: int) -> GroupRanking:
+    return GroupRanking(
+        group_id=group_id,
+        exercise_id=record.exercise_id,
+        user_id=record.user_id,
+        estimated_max=record.estimated_max,
+        relative_score=record.relative_score,
+        achieved_at=record.achieved_at,
+    )
+
+
+def sync_rankings(records: Iterable[UserExercisePR]) -> None:
+    records = list(records)
+    if not records:
+        return
+
+    groups_by_user: dict[int, list[int]] = defaultdict(list)
+    for user_id, group_id in GroupMembership.objects.filter(
+        status=GroupMembership.MembershipStatus.ACCEPTED,
+        user__in={record.user_id for record in records},
+    ).values_list("user_id", "group_id"):
+        groups_by_user[user_id].append(group_id)
+
+    _upsert_rankings(
+        _ranking_from_record(record, group_id)
+        for record in records
+        for group_id in groups_by_user[record.user_id]
+    )
+
+
+def add_member_rankings(user: User, group: Group) -> None:
+    add_members_rankings([(user.pk, group.pk)])
+
+
+def add_members_rankings(memberships: Iterable[tuple[int, int]]) -> None:
+    groups_by_user: dict[int, list[int]] = defaultdict(list)
+    for user_id, group_id in memberships:
+        groups_by_user[user_id].append(group_id)
+    if not groups_by_user:
+        return
+
+    _upsert_rankings(
+        _ranking_from_record(record, group_id)
+        for record in UserExercisePR.objects.filter(user__in=groups_by_user)
+        for group_id in groups_by_user[record.user_id]
+    )
+
+
+def remove_member_rankings(user: User, group: Group) -> None:
+    GroupRanking.objects.filter(user=user, group=group).delete()
+
+
+def rebuild_rankings(batch_size: int = 1000) -> int:
+    GroupRanking.objects.all().delete()
+
+    rows = UserExercisePR.objects.filter(
+        user__group_memberships__status=GroupMembership.MembershipStatus.ACCEPTED
+    ).values_list(
+        "user_id",
+        "exercise_id",
+        "estimated_max",
+        "relative_score",
+        "achieved_at",
+        F("user__group_memberships__group"),
+    )
+
+    created = 0
+    batch: list[GroupRanking] = []
+    for (
+        user_id,
+        exercise_id,
+        estimated_max,
+        score,
+        achieved_at,
+        group_id,
+    ) in rows.iterator(chunk_size=batch_size):
+        batch.append(
+            GroupRanking(
+                group_id=group_id,
+                exercise_id=exercise_id,
+                user_id=user_id,
+                estimated_max=estimated_max,
+                relative_score=score,
+                achieved_at=achieved_at,
+            )
+        )
+
+        if len(batch) >= batch_size:
+            created += len(GroupRanking.objects.bulk_create(batch))
+            batch = []
+
+    created += len(GroupRanking.objects.bulk_create(batch))
+    return created
@@ -1,9 +1,10 @@
+from collections import defaultdict
 from typing import Any, cast
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
 from django.db import transaction
-from django.db.models import Q, Count, QuerySet
+from django.db.models import Q, QuerySet
 from django.http import HttpRequest, HttpResponse
 from django.urls import reverse, reverse_lazy
 from django.views.generic import (
@@ -14,8 +15,12 @@ from django.views.generic import (
     TemplateView,
 )
 
+from groups.counters import membership_changed
 from groups.forms import GroupForm
 from groups.models import Group, GroupMembership, GroupAddRequest
+from groups.services import add_member_rankings
+from notifications.models import Notification
+from notifications.services import notify_group_members
 
 
 class GroupDashboardView(LoginRequiredMixin, TemplateView):
@@ -25,26 +30,50 @@ class GroupDashboardView(LoginRequiredMixin, TemplateView):
         user = cast(User, self.request.user)
         context = super().get_context_data(**kwargs)
 
-        groups_hosted = user.groups_hosted.with_member_count()
-
-        groups_joined = (
-            Group.objects.with_member_count()
-            .filter(
-                user_memberships__status=GroupMembership.MembershipStatus.ACCEPTED,
-                user_memberships__user=user,
+        # The user's memberships and pending requests are both read through
+        # their user index in one UNION, then every related group is loaded
+        # with its admin in a single query.
+        relations = (
+            GroupMembership.objects.filter(
+                user=user,
+                status__in=[
+                    GroupMembership.MembershipStatus.ACCEPTED,
+                    GroupMembership.MembershipStatus.BLOCKED,
+                ],
+            )
+            .values_list("group_id", "status")
+            .union(
+                GroupAddRequest.objects.filter(
+                    user=user, status=GroupAddRequest.RequestStatus.PENDING
+                ).values_list("group_id", "status"),
+                all=True,
             )
-            .exclude(admin_user=user)
         )
-
-        groups_blocked = Group.objects.with_member_count().filter(
-            user_memberships__status=GroupMembership.MembershipStatus.BLOCKED,
-            user_memberships__user=user,
+        statuses: dict[int, set[str]] = defaultdict(set)
+        for group_id, status in relations:
+            statuses[group_id].add(status)
+
+        groups = (
+            Group.objects.filter(Q(admin_user=user) | Q(pk__in=statuses))
+            .select_related("admin_user")
+            .order_by("pk")
         )
 
-        groups_pending = Group.objects.with_member_count().filter(
-            user_add_requests__status=GroupAddRequest.RequestStatus.PENDING,
-            user_add_requests__user=user,
-        )
+        groups_hosted = []
+        groups_joined = []
+        groups_blocked = []
+        groups_pending = []
+        for group in groups:
+            group_statuses = statuses.get(group.pk, set())
+            if group.admin_user_id == user.pk:
+                groups_hosted.append(group)
+            elif GroupMembership.MembershipStatus.ACCEPTED in group_statuses:
+                groups_joined.append(group)
+
+            if GroupMembership.MembershipStatus.BLOCKED in group_statuses:
+                groups_blocked.append(group)
+            if GroupAddRequest.RequestStatus.PENDING in group_statuses:
+                groups_pending.append(group)
 
         context["groups_hosted"] = groups_hosted
         context["groups_joined"] = groups_joined
@@ -74,6 +103,11 @@ class GroupCreateView(LoginRequiredMixin, CreateView):
             user=user,
             group=self.object,
         )
+        membership_changed(
+            self.object.pk, None, GroupMembership.MembershipStatus.ACCEPTED
+        )
+
+        add_member_rankings(user, self.object)
 
         messages.success(
             self.request,
@@ -90,28 +124,10 @@ class GroupDetailView(LoginRequiredMixin, DetailView):
 
     def get_queryset(self) -> QuerySet[Group]:
         user = cast(User, self.request.user)
-        return (
-            self.model.objects.with_member_count()
-            .filter(
-                user_memberships__user=user,
-                user_memberships__status=GroupMembership.MembershipStatus.ACCEPTED,
-            )
-            .annotate(
-                pending_requests=Count(
-                    "user_add_requests",
-                    filter=Q(
-                        user_add_requests__status=GroupAddRequest.RequestStatus.PENDING
-                    ),
-                ),
-                blocked_users_count=Count(
-                    "user_memberships",
-                    filter=Q(
-                        user_memberships__status=GroupMembership.MembershipStatus.BLOCKED
-                    ),
-                ),
-            )
-            .select_related("admin_user__profile")
-        )
+        return self.model.objects.filter(
+            user_memberships__user=user,
+            user_memberships__status=GroupMembership.MembershipStatus.ACCEPTED,
+        ).select_related("admin_user__profile")
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         user = cast(User, self.request.user)
@@ -138,12 +154,23 @@ class GroupUpdateView(LoginRequiredMixin, UpdateView):
     def get_success_url(self) -> str:
         return reverse("group_detail", kwargs={"pk": self.object.pk})
 
+    @transaction.atomic
     def form_valid(self, form: GroupForm) -> HttpResponse:
+        user = cast(User, self.request.user)
+        response = super().form_valid(form)
+
+        notify_group_members(
+            Notification.NotificationType.GROUP_UPDATED,
+            self.object,
+            notification_user=user,
+            exclude=user,
+        )
+
         messages.success(
             self.request,
             f"Group '{self.object.name}' updated successfully!",
         )
-        return super().form_valid(form)
+        return response
 
     def form_invalid(self, form: GroupForm) -> HttpResponse:
         messages.error(
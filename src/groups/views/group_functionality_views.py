@@ -4,7 +4,7 @@ from django.utils import timezone
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib import messages
 from django.contrib.auth.models import User
-from django.db.models import Case, When, BooleanField, Exists, OuterRef, Q, QuerySet
+from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
@@ -12,12 +12,16 @@ from django.views.generic import (
     View,
     ListView,
     CreateView,
-    TemplateView,
 )
 
+from groups.counters import membership_changed, update_counters
 from groups.forms import GroupAddRequestForm
-from groups.models import Group, GroupMembership, GroupAddRequest
+from exercises.models import Exercise
+from groups.models import Group, GroupMembership, GroupAddRequest, GroupRanking
+from groups.search import search_groups
+from groups.services import add_member_rankings, remove_member_rankings
 from notifications.models import Notification
+from notifications.services import notify
 
 
 class GroupUserListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
@@ -83,7 +87,7 @@ class GroupUserKickView(LoginRequiredMixin, View):
             return redirect("group_detail", pk=pk)
 
         membership = get_object_or_404(
-            GroupMembership,
+            GroupMembership.objects.select_for_update(),
             user=user_to_kick,
             group=group,
             status=GroupMembership.MembershipStatus.ACCEPTED,
@@ -91,8 +95,15 @@ class GroupUserKickView(LoginRequiredMixin, View):
         membership.status = GroupMembership.MembershipStatus.KICKED
         membership.kicked_at = timezone.now()
         membership.save()
+        membership_changed(
+            group.pk,
+            GroupMembership.MembershipStatus.ACCEPTED,
+            GroupMembership.MembershipStatus.KICKED,
+        )
+
+        remove_member_rankings(user_to_kick, group)
 
-        Notification.objects.create(
+        notify(
             type=Notification.NotificationType.GROUP_KICK,
             user=user_to_kick,
             notification_user=user,
@@ -109,6 +120,7 @@ class GroupUserKickView(LoginRequiredMixin, View):
 
 
 class GroupUserBlockView(LoginRequiredMixin, View):
+    @transaction.atomic
     def post(self, request: HttpRequest, pk: int, user_pk: int) -> HttpResponse:
         user = cast(User, request.user)
         group = get_object_or_404(Group, pk=pk)
@@ -122,12 +134,18 @@ class GroupUserBlockView(LoginRequiredMixin, View):
             messages.error(request, "You cannot block yourself.")
             return redirect("group_detail", pk=pk)
 
-        membership = get_object_or_404(GroupMembership, user=user_to_block, group=group)
+        membership = get_object_or_404(
+            GroupMembership.objects.select_for_update(), user=user_to_block, group=group
+        )
+        previous_status = membership.status
         membership.status = GroupMembership.MembershipStatus.BLOCKED
         membership.blocked_at = timezone.now()
         membership.save()
+        membership_changed(group.pk, previous_status, membership.status)
+
+        remove_member_rankings(user_to_block, group)
 
-        Notification.objects.create(
+        notify(
             type=Notification.NotificationType.GROUP_BLOCK,
             user=user_to_block,
             notification_user=user,
@@ -180,27 +198,35 @@ class GroupAcceptRequestView(LoginRequiredMixin, View):
     def post(self, request: HttpRequest, pk: int, request_pk: int) -> HttpResponse:
         user = cast(User, request.user)
         group = get_object_or_404(Group, pk=pk)
-        join_request = get_object_or_404(GroupAddRequest, pk=request_pk)
+        join_request = get_object_or_404(
+            GroupAddRequest.objects.select_for_update(), pk=request_pk, group=group
+        )
 
         if user != group.admin_user:
             messages.error(request, "Only the group admin can accept join requests.")
             return redirect("group_detail", pk=pk)
 
+        if join_request.status == GroupAddRequest.RequestStatus.PENDING:
+            update_counters(join_request.group_id, pending_requests_count=-1)
         join_request.status = GroupAddRequest.RequestStatus.ACCEPTED
         join_request.save()
 
-        membership, created = GroupMembership.objects.get_or_create(
+        membership, created = GroupMembership.objects.select_for_update().get_or_create(
             user=join_request.user,
             group=group,
             defaults={"status": GroupMembership.MembershipStatus.ACCEPTED},
         )
+        previous_status = None if created else membership.status
         if not created:
             membership.status = GroupMembership.MembershipStatus.ACCEPTED
             membership.kicked_at = None
             membership.blocked_at = None
             membership.save()
+        membership_changed(group.pk, previous_status, membership.status)
+
+        add_member_rankings(join_request.user, group)
 
-        Notification.objects.create(
+        notify(
             type=Notification.NotificationType.GROUP_REQUEST_ACCEPTED,
             user=join_request.user,
             notification_user=user,
@@ -221,18 +247,21 @@ class GroupDeclineRequestView(LoginRequiredMixin, View):
         user = cast(User, request.user)
         group = get_object_or_404(Group, pk=pk)
         join_request = get_object_or_404(
-            GroupAddRequest,
+            GroupAddRequest.objects.select_for_update(),
             pk=request_pk,
+            group=group,
         )
 
         if user != group.admin_user:
             messages.error(request, "Only the group admin can decline join requests.")
             return redirect("group_detail", pk=pk)
 
+        if join_request.status == GroupAddRequest.RequestStatus.PENDING:
+            update_counters(join_request.group_id, pending_requests_count=-1)
         join_request.status = GroupAddRequest.RequestStatus.DECLINED
         join_request.save()
 
-        Notification.objects.create(
+        notify(
             type=Notification.NotificationType.GROUP_REQUEST_DECLINED,
             user=join_request.user,
             notification_user=user,
@@ -313,8 +342,9 @@ class GroupUnblockUserView(LoginRequiredMixin, UserPassesTestMixin, View):
 
         if membership:
             membership.delete()
+            membership_changed(self.group.pk, membership.status, None)
 
-            Notification.objects.create(
+            notify(
                 type=Notification.NotificationType.GROUP_UNBLOCK,
                 user=self.user_to_unblock,
                 notification_user=user,
@@ -333,11 +363,63 @@ class GroupUnblockUserView(LoginRequiredMixin, UserPassesTestMixin, View):
         return redirect("group_user_blocked_list", pk=self.group.pk)
 
 
-class GroupRankingsView(TemplateView):
+class GroupRankingsView(LoginRequiredMixin, UserPassesTestMixin, ListView):
+    model = GroupRanking
     template_name = "groups/group_functionality/group_rankings.html"
+    context_object_name = "rankings"
+    paginate_by = 10
+    group: Group
+    exercise: Exercise | None
+    relative: bool
+
+    def setup(self, request: HttpRequest, *args: Any, **kwargs: Any) -> None:
+        super().setup(request, *args, **kwargs)
+        self.group = get_object_or_404(Group, pk=kwargs.get("pk"))
+        self.relative = request.GET.get("metric") == "relative"
+
+        exercises = Exercise.objects.order_by("pk")
+        exercise_pk = request.GET.get("exercise")
+        if exercise_pk and exercise_pk.isdigit():
+            exercises = exercises.filter(pk=exercise_pk)
+        self.exercise = exercises.first()
+
+    def test_func(self) -> bool:
+        user = cast(User, self.request.user)
+        return GroupMembership.objects.filter(
+            status=GroupMembership.MembershipStatus.ACCEPTED,
+            user=user,
+            group=self.group,
+        ).exists()
+
+    def handle_no_permission(self) -> HttpResponseRedirect:
+        messages.error(
+            self.request,
+            "You must be a member of this group to view its rankings.",
+        )
+        return redirect("group_detail", pk=self.group.pk)
+
+    def get_queryset(self) -> QuerySet[GroupRanking]:
+        queryset = self.model.objects.filter(
+            group=self.group, exercise=self.exercise
+        ).select_related("user__profile")
+
+        if self.relative:
+            return queryset.filter(relative_score__isnull=False).order_by(
+                "-relative_score", "achieved_at"
+            )
+        return queryset.order_by("-estimated_max", "achieved_at")
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context["group"] = self.group
+        context["exercise"] = self.exercise
+        context["exercises"] = Exercise.objects.order_by("pk")
+        context["relative"] = self.relative
+        return context
 
 
 class GroupExitView(LoginRequiredMixin, View):
+    @transaction.atomic
     def post(self, request: HttpRequest, pk: int) -> HttpResponse:
         user = cast(User, request.user)
         group = get_object_or_404(Group, pk=pk)
@@ -349,10 +431,16 @@ class GroupExitView(LoginRequiredMixin, View):
             )
             return redirect("group_detail", pk=pk)
 
-        membership = GroupMembership.objects.filter(user=user, group=group).first()
+        membership = (
+            GroupMembership.objects.select_for_update()
+            .filter(user=user, group=group)
+            .first()
+        )
 
         if membership:
             membership.delete()
+            membership_changed(group.pk, membership.status, None)
+            remove_member_rankings(user, group)
             messages.success(
                 request,
                 f"You have successfully left '{group.name}'.",
@@ -373,45 +461,44 @@ class GroupSearchView(LoginRequiredMixin, ListView):
     paginate_by = 10
 
     def get_queryset(self) -> QuerySet[Group]:
+        return search_groups(
+            self.model.objects.select_related("admin_user"),
+            self.request.GET.get("q", ""),
+        )
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         user = cast(User, self.request.user)
-        queryset = self.model.objects.with_member_count().annotate(
-            is_admin=Case(
-                When(admin_user=user, then=True),
-                default=False,
-                output_field=BooleanField(),
-            ),
-            is_member=Exists(
-                GroupMembership.objects.filter(
-                    status=GroupMembership.MembershipStatus.ACCEPTED,
-                    user=user,
-                    group=OuterRef("pk"),
-                )
-            ),
-            is_blocked=Exists(
-                GroupMembership.objects.filter(
-                    status=GroupMembership.MembershipStatus.BLOCKED,
-                    user=user,
-                    group=OuterRef("pk"),
-                )
-            ),
-            is_pending=Exists(
-                GroupAddRequest.objects.filter(
-                    status=GroupAddRequest.RequestStatus.PENDING,
-                    user=user,
-                    group=OuterRef("pk"),
-                )
-            ),
+        context = super().get_context_data(**kwargs)
+
+        # Flags are only resolved for the groups of the current page.
+        groups = list(context["groups"])
+        page_ids = [group.pk for group in groups]
+
+        memberships = dict(
+            GroupMembership.objects.filter(user=user, group__in=page_ids).values_list(
+                "group", "status"
+            )
+        )
+        pending_groups = set(
+            GroupAddRequest.objects.filter(
+                status=GroupAddRequest.RequestStatus.PENDING,
+                user=user,
+                group__in=page_ids,
+            ).values_list("group", flat=True)
         )
 
-        search_query = self.request.GET.get("q")
-        if search_query:
-            queryset = queryset.filter(
-                Q(name__icontains=search_query)
-                | Q(description__icontains=search_query)
-                | Q(admin_user__username__icontains=search_query)
+        for group in groups:
+            group.is_admin = group.admin_user_id == user.pk
+            group.is_member = (
+                memberships.get(group.pk) == GroupMembership.MembershipStatus.ACCEPTED
             )
+            group.is_blocked = (
+                memberships.get(group.pk) == GroupMembership.MembershipStatus.BLOCKED
+            )
+            group.is_pending = group.pk in pending_groups
 
-        return queryset
+        context["groups"] = context["object_list"] = groups
+        return context
 
 
 class GroupSendRequestView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
@@ -486,6 +573,7 @@ class GroupSendRequestView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
 
         return redirect("group_search")
 
+    @transaction.atomic
     def form_valid(self, form: GroupAddRequestForm) -> HttpResponse:
         user = cast(User, self.request.user)
         form.instance.status = GroupAddRequest.RequestStatus.PENDING
@@ -493,8 +581,9 @@ class GroupSendRequestView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
         form.instance.group = self.group
 
         response = super().form_valid(form)
+        update_counters(self.group.pk, pending_requests_count=1)
 
-        Notification.objects.create(
+        notify(
             type=Notification.NotificationType.GROUP_REQUEST_RECEIVED,
             user=self.group.admin_user,
             notification_user=user,
@@ -0,0 +1,9 @@
+from django.http import HttpRequest
+
+from notifications.counters import get_unread_count
+
+
+def unread_notifications(request: HttpRequest) -> dict[str, int]:
+    if not request.user.is_authenticated:
+        return {}
+    return {"unread_notifications_count": get_unread_count(request.user.pk)}
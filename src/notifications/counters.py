@@ -0,0 +1,83 @@
+from collections.abc import Iterable
+
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models import Count, Q
+
+from notifications.models import Notification
+
+UNREAD_COUNT_KEY = "notifications:unread:{user_id}"
+UNREAD_COUNT_TIMEOUT = 60 * 60 * 24
+
+
+def _key(user_id: int) -> str:
+    return UNREAD_COUNT_KEY.format(user_id=user_id)
+
+
+def uses_shared_cache() -> bool:
+    # A process-local cache only ever sees the counters of its own process.
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def get_unread_count(user_id: int) -> int:
+    count: int | None = cache.get(_key(user_id))
+    if count is None:
+        # Only a cold cache reaches the database, every later read is O(1).
+        count = Notification.objects.filter(user_id=user_id, is_read=False).count()
+        cache.set(_key(user_id), count, UNREAD_COUNT_TIMEOUT)
+    return max(count, 0)
+
+
+def _add(user_id: int, delta: int) -> None:
+    try:
+        cache.incr(_key(user_id), delta)
+    except ValueError:
+        # Nothing cached yet, the next read counts from the database.
+        pass
+
+
+def increment_unread_count(user_id: int, delta: int = 1) -> None:
+    # Counters only move once the notification rows are actually committed.
+    transaction.on_commit(lambda: _add(user_id, delta))
+
+
+def decrement_unread_count(user_id: int, delta: int = 1) -> None:
+    transaction.on_commit(lambda: _add(user_id, -delta))
+
+
+def clear_unread_count(user_id: int) -> None:
+    transaction.on_commit(lambda: cache.set(_key(user_id), 0, UNREAD_COUNT_TIMEOUT))
+
+
+def reset_unread_count(user_id: int) -> None:
+    transaction.on_commit(lambda: cache.delete(_key(user_id)))
+
+
+def reconcile_unread_counts(
+    user_ids: Iterable[int] | None = None, batch_size: int = 1000
+) -> int:
+    users = User.objects.all()
+    if user_ids is not None:
+        users = users.filter(pk__in=user_ids)
+
+    rows = users.annotate(
+        unread=Count(
+            "notifications_received", filter=Q(notifications_received__is_read=False)
+        )
+    ).values_list("pk", "unread")
+
+    reconciled = 0
+    batch: dict[str, int] = {}
+    for user_id, unread in rows.iterator(chunk_size=batch_size):
+        batch[_key(user_id)] = unread
+
+        if len(batch) >= batch_size:
+            cache.set_many(batch, UNREAD_COUNT_TIMEOUT)
+            reconciled += len(batch)
+            batch = {}
+
+    cache.set_many(batch, UNREAD_COUNT_TIMEOUT)
+    return reconciled + len(batch)
@@ -0,0 +1,52 @@
+import time
+from argparse import ArgumentParser
+from datetime import timedelta
+from typing import Any
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from notifications.models import Notification
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=90,
+            help="Delete read notifications received more than N days ago.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Seconds to pause between batches to spare the database.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options["batch_size"]
+        cutoff = timezone.now() - timedelta(days=options["days"])
+
+        self.stdout.write(f"Deleting read notifications older than {cutoff}...")
+
+        notifications = Notification.objects.filter(
+            is_read=True, received_at__lt=cutoff
+        ).order_by()
+
+        nb_deleted = 0
+        while True:
+            # Every batch is its own short statement so locks are never held long.
+            batch = list(notifications.values_list("pk", flat=True)[:batch_size])
+            if not batch:
+                break
+
+            deleted, _ = Notification.objects.filter(pk__in=batch).delete()
+            nb_deleted += deleted
+            self.stdout.write(f"Deleted {nb_deleted} notification(s)...")
+
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(f"Successfully deleted {nb_deleted} notification(s)!")
@@ -0,0 +1,25 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management import BaseCommand, CommandError
+
+from notifications.counters import reconcile_unread_counts, uses_shared_cache
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not uses_shared_cache():
+            raise CommandError(
+                "The default cache is local to this process, reconciled counters "
+                "would never reach the web processes. Set REDIS_URL to share it "
+                "first."
+            )
+
+        self.stdout.write("Reconciling unread notification counters...")
+
+        nb_users = reconcile_unread_counts(batch_size=options["batch_size"])
+
+        self.stdout.write(f"Successfully reconciled {nb_users} counter(s)!")
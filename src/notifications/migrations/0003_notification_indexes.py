@@ -0,0 +1,34 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("groups", "0007_groupranking_relative_score"),
+        (
+            "notifications",
+            "0002_alter_notification_options_notification_is_read_and_more",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "-received_at", "-id"],
+                name="notifications_user_received",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                condition=models.Q(("is_read", False)),
+                fields=["user"],
+                name="notifications_user_unread",
+            ),
+        ),
+    ]
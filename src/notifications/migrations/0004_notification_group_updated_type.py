@@ -0,0 +1,35 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0003_notification_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="notification",
+            name="type",
+            field=models.CharField(
+                choices=[
+                    ("friend_request_received", "Friend Request Received"),
+                    ("friend_request_accepted", "Friend Request Accepted"),
+                    ("friend_request_declined", "Friend Request Declined"),
+                    ("user_kick", "User Kick"),
+                    ("user_block", "User Block"),
+                    ("user_unblock", "User Unblock"),
+                    ("group_request_received", "Group Request Received"),
+                    ("group_request_accepted", "Group Request Accepted"),
+                    ("group_request_declined", "Group Request Declined"),
+                    ("group_kick", "Group Kick"),
+                    ("group_block", "Group Block"),
+                    ("group_unblock", "Group Unblock"),
+                    ("group_updated", "Group Updated"),
+                ],
+                max_length=30,
+            ),
+        ),
+    ]
@@ -0,0 +1,76 @@
+from django.db import migrations, models
+from django.urls import reverse
+
+MESSAGES = {
+    "friend_request_received": "{user} has sent you a friendship request",
+    "friend_request_accepted": "{user} has accepted your friendship request",
+    "friend_request_declined": "{user} has declined your friendship request",
+    "user_kick": "{user} has kicked you from friends",
+    "user_block": "{user} has blocked you",
+    "user_unblock": "{user} has unblocked you",
+    "group_request_received": "{user} wants to join to your {group} group",
+    "group_request_accepted": "{user} has accepted your request to join {group} group",
+    "group_request_declined": "{user} has declined your request to join {group} group",
+    "group_kick": "{user} has kicked you from {group} group",
+    "group_block": "{user} has blocked you from {group} group",
+    "group_unblock": "{user} has unblocked you from {group} group",
+    "group_updated": "{user} has updated the {group} group",
+}
+
+
+def _url(notification_type, group_id):
+    match notification_type:
+        case "friend_request_received":
+            return reverse("friend_request_received_list")
+        case "group_request_received":
+            return reverse("group_request_list", kwargs={"pk": group_id})
+        case "group_request_accepted" | "group_updated":
+            return reverse("group_detail", kwargs={"pk": group_id})
+    return ""
+
+
+def populate_message_url(apps, schema_editor):
+    Notification = apps.get_model("notifications", "Notification")
+
+    notifications = Notification.objects.select_related(
+        "notification_user", "notification_group"
+    ).order_by("pk")
+
+    batch = []
+    for notification in notifications.iterator(chunk_size=1000):
+        template = MESSAGES.get(notification.type, "Notification")
+        # Historical models have no __str__, so mirror it with the name fields.
+        notification.message = template.format(
+            user=getattr(notification.notification_user, "username", None),
+            group=getattr(notification.notification_group, "name", None),
+        )
+        notification.url = _url(notification.type, notification.notification_group_id)
+        batch.append(notification)
+
+        if len(batch) >= 1000:
+            Notification.objects.bulk_update(batch, ["message", "url"])
+            batch = []
+
+    Notification.objects.bulk_update(batch, ["message", "url"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0004_notification_group_updated_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="message",
+            field=models.CharField(default="", max_length=255),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="url",
+            field=models.CharField(blank=True, max_length=200),
+        ),
+        migrations.RunPython(populate_message_url, migrations.RunPython.noop),
+    ]
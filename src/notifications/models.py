@@ -3,7 +3,7 @@ from django.urls import reverse
 from django.contrib.auth.models import User
 
 from groups.models import Group
-from typing import cast
+from typing import Any, cast
 
 
 class Notification(models.Model):
@@ -20,10 +20,13 @@ class Notification(models.Model):
         GROUP_KICK = "group_kick"
         GROUP_BLOCK = "group_block"
         GROUP_UNBLOCK = "group_unblock"
+        GROUP_UPDATED = "group_updated"
 
     type = models.CharField(max_length=30, choices=NotificationType.choices)
     received_at = models.DateTimeField(auto_now_add=True)
     is_read = models.BooleanField(default=False)
+    message = models.CharField(max_length=255)
+    url = models.CharField(max_length=200, blank=True)
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="notifications_received"
     )
@@ -43,9 +46,29 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ["-received_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "-received_at", "-id"],
+                name="notifications_user_received",
+            ),
+            models.Index(
+                fields=["user"],
+                condition=models.Q(is_read=False),
+                name="notifications_user_unread",
+            ),
+        ]
 
-    @property
-    def message(self) -> str:
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        if not self.message:
+            self.snapshot()
+        super().save(*args, **kwargs)
+
+    def snapshot(self) -> None:
+        # Rendered once at creation so listings never join or reverse() per row.
+        self.message = self.build_message()
+        self.url = self.build_url() or ""
+
+    def build_message(self) -> str:
         notification_user = cast(User, self.notification_user)
         notification_group = cast(Group, self.notification_group)
 
@@ -74,10 +97,11 @@ class Notification(models.Model):
                 return f"{notification_user} has blocked you from {notification_group} group"
             case self.NotificationType.GROUP_UNBLOCK:
                 return f"{notification_user} has unblocked you from {notification_group} group"
+            case self.NotificationType.GROUP_UPDATED:
+                return f"{notification_user} has updated the {notification_group} group"
         return "Notification"
 
-    @property
-    def url(self) -> str | None:
+    def build_url(self) -> str | None:
         notification_group = cast(Group, self.notification_group)
 
         match self.type:
@@ -87,6 +111,9 @@ class Notification(models.Model):
                 return reverse(
                     "group_request_list", kwargs={"pk": notification_group.pk}
                 )
-            case self.NotificationType.GROUP_REQUEST_ACCEPTED:
+            case (
+                self.NotificationType.GROUP_REQUEST_ACCEPTED
+                | self.NotificationType.GROUP_UPDATED
+            ):
                 return reverse("group_detail", kwargs={"pk": notification_group.pk})
         return None
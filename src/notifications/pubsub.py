@@ -0,0 +1,75 @@
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from functools import cache
+from typing import Any
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+Payload = dict[str, Any]
+
+
+class NotificationBroker(ABC):
+    @abstractmethod
+    def publish(self, user_id: int, payload: Payload) -> None: ...
+
+    @abstractmethod
+    def subscribe(
+        self, user_id: int
+    ) -> AbstractAsyncContextManager["asyncio.Queue[Payload]"]: ...
+
+
+class LocalBroker(NotificationBroker):
+    # Only reaches connections served by the current process.
+    queue_size = 100
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: dict[
+            int, set[tuple[asyncio.AbstractEventLoop, asyncio.Queue[Payload]]]
+        ] = defaultdict(set)
+
+    def publish(self, user_id: int, payload: Payload) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+
+        # Publishers usually run in a sync worker thread, so hand the payload
+        # over to each subscriber's event loop instead of touching its queue.
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, payload)
+            except RuntimeError:
+                pass
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: int) -> AsyncIterator[asyncio.Queue[Payload]]:
+        subscriber = (
+            asyncio.get_running_loop(),
+            asyncio.Queue[Payload](maxsize=self.queue_size),
+        )
+        with self._lock:
+            self._subscribers[user_id].add(subscriber)
+
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                self._subscribers[user_id].discard(subscriber)
+                if not self._subscribers[user_id]:
+                    del self._subscribers[user_id]
+
+    @staticmethod
+    def _deliver(queue: asyncio.Queue[Payload], payload: Payload) -> None:
+        # A slow client loses its oldest events rather than growing the queue.
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(payload)
+
+
+@cache
+def get_broker() -> NotificationBroker:
+    return import_string(settings.NOTIFICATIONS_BROKER)()  # type: ignore[no-any-return]
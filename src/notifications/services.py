@@ -0,0 +1,150 @@
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+from functools import partial
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.utils import timezone
+
+from groups.models import Group, GroupMembership
+from notifications.counters import increment_unread_count
+from notifications.models import Notification
+from notifications.pubsub import Payload, get_broker
+
+
+class NotificationBatch:
+    def __init__(self, notifications: list[Notification]) -> None:
+        self.notifications = notifications
+
+    def __call__(self) -> None:
+        created = Notification.objects.bulk_create(self.notifications)
+        for user_id, count in Counter(
+            notification.user_id for notification in created
+        ).items():
+            increment_unread_count(user_id, count)
+
+        publish(
+            (
+                notification.user_id,
+                _payload(
+                    notification.pk,
+                    notification.type,
+                    notification.message,
+                    notification.url,
+                    notification.received_at,
+                ),
+            )
+            for notification in created
+        )
+
+
+def _payload(
+    pk: int, type: str, message: str, url: str, received_at: datetime
+) -> Payload:
+    return {
+        "id": pk,
+        "type": type,
+        "message": message,
+        "url": url,
+        "received_at": received_at.isoformat(),
+    }
+
+
+def publish(messages: Iterable[tuple[int, Payload]]) -> None:
+    broker = get_broker()
+    for user_id, payload in messages:
+        broker.publish(user_id, payload)
+
+
+def notify(
+    type: Notification.NotificationType,
+    user: User,
+    notification_user: User | None = None,
+    notification_group: Group | None = None,
+) -> None:
+    notify_many(
+        [
+            Notification(
+                type=type,
+                user=user,
+                notification_user=notification_user,
+                notification_group=notification_group,
+            )
+        ]
+    )
+
+
+def notify_many(notifications: Iterable[Notification]) -> None:
+    notifications = list(notifications)
+    for notification in notifications:
+        notification.snapshot()
+
+    # Each batch is written once its transaction commits, in one bulk_create.
+    # A savepoint rolled back drops the batches queued inside it with it.
+    transaction.on_commit(NotificationBatch(notifications))
+
+
+def notify_group_members(
+    type: Notification.NotificationType,
+    group: Group,
+    notification_user: User | None = None,
+    exclude: User | None = None,
+) -> None:
+    # Messages never mention the recipient, so one snapshot serves every member.
+    snapshot = Notification(
+        type=type, notification_user=notification_user, notification_group=group
+    )
+    snapshot.snapshot()
+
+    # Queued like any other batch, see notify_many.
+    transaction.on_commit(
+        partial(
+            _insert_group_notifications,
+            snapshot,
+            exclude.pk if exclude is not None else None,
+        )
+    )
+
+
+def _insert_group_notifications(snapshot: Notification, exclude_id: int | None) -> None:
+    # One INSERT ... SELECT over the memberships instead of a row per member.
+    notification_table = Notification._meta.db_table
+    membership_table = GroupMembership._meta.db_table
+
+    sql = (
+        f"INSERT INTO {notification_table} "
+        "(type, received_at, is_read, message, url, user_id, "
+        "notification_user_id, notification_group_id) "
+        "SELECT %s, %s, %s, %s, %s, user_id, %s, group_id "
+        f"FROM {membership_table} WHERE group_id = %s AND status = %s"
+    )
+    received_at = timezone.now()
+    params: list[str | int | bool | datetime | None] = [
+        snapshot.type,
+        received_at,
+        False,
+        snapshot.message,
+        snapshot.url,
+        snapshot.notification_user_id,
+        snapshot.notification_group_id,
+        GroupMembership.MembershipStatus.ACCEPTED,
+    ]
+    if exclude_id is not None:
+        sql += " AND user_id <> %s"
+        params.append(exclude_id)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql + " RETURNING id, user_id", params)
+        rows = cursor.fetchall()
+
+    for user_id, count in Counter(user_id for _, user_id in rows).items():
+        increment_unread_count(user_id, count)
+
+    publish(
+        (
+            user_id,
+            _payload(pk, snapshot.type, snapshot.message, snapshot.url, received_at),
+        )
+        for pk, user_id in rows
+    )
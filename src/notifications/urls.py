@@ -1,5 +1,21 @@
 from django.urls import path
 
-from .views import NotificationListView
+from .views import (
+    NotificationListView,
+    NotificationReadAllView,
+    NotificationReadPageView,
+    NotificationReadView,
+    NotificationStreamView,
+)
 
-urlpatterns = [path("", NotificationListView.as_view(), name="notification_list")]
+urlpatterns = [
+    path("", NotificationListView.as_view(), name="notification_list"),
+    path("stream/", NotificationStreamView.as_view(), name="notification_stream"),
+    path("read/", NotificationReadAllView.as_view(), name="notification_read_all"),
+    path(
+        "read/page/",
+        NotificationReadPageView.as_view(),
+        name="notification_read_page",
+    ),
+    path("<int:pk>/read/", NotificationReadView.as_view(), name="notification_read"),
+]
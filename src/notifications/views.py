@@ -1,21 +1,130 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db.models import QuerySet
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
+from django.shortcuts import redirect
+from django.urls import reverse
+from django.utils.http import url_has_allowed_host_and_scheme
+from django.views import View
 from django.views.generic import ListView
-from typing import cast
 from django.contrib.auth.models import User
 
+from common.pagination import KeysetPaginationMixin
+
+from .counters import clear_unread_count, decrement_unread_count
 from .models import Notification
+from .pubsub import get_broker
 
 
-class NotificationListView(LoginRequiredMixin, ListView):
+class NotificationListView(LoginRequiredMixin, KeysetPaginationMixin, ListView):
     model = Notification
     template_name = "notifications/notification_list.html"
     context_object_name = "notifications"
-    paginate_by = 10
+    keyset_field = "received_at"
 
     def get_queryset(self) -> QuerySet[Notification]:
         user = cast(User, self.request.user)
+        queryset = self.model.objects.filter(user=user).only(
+            "type", "received_at", "is_read", "message", "url"
+        )
+        # Walks the (user, -received_at, -id) index.
+        return self.paginate_keyset(queryset)
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        notifications, cursors = self.get_keyset_page(self.object_list)
+        context = super().get_context_data(object_list=notifications, **kwargs)
+        context.update(cursors)
+        return context
+
+
+def _redirect_to_list(request: HttpRequest) -> HttpResponseRedirect:
+    next_url = request.POST.get("next", "")
+    if next_url.startswith(reverse("notification_list")) and (
+        url_has_allowed_host_and_scheme(next_url, allowed_hosts=None)
+    ):
+        return redirect(next_url)
+    return redirect("notification_list")
+
+
+class NotificationReadView(LoginRequiredMixin, View):
+    def post(self, request: HttpRequest, pk: int) -> HttpResponseRedirect:
+        user = cast(User, request.user)
+
+        if Notification.objects.filter(pk=pk, user=user, is_read=False).update(
+            is_read=True
+        ):
+            decrement_unread_count(user.pk)
+
+        return _redirect_to_list(request)
+
+
+class NotificationReadAllView(LoginRequiredMixin, View):
+    def post(self, request: HttpRequest) -> HttpResponseRedirect:
+        user = cast(User, request.user)
+
+        Notification.objects.filter(user=user, is_read=False).update(is_read=True)
+        clear_unread_count(user.pk)
 
-        return self.model.objects.filter(user=user).select_related(
-            "notification_user", "notification_group"
+        return _redirect_to_list(request)
+
+
+class NotificationReadPageView(LoginRequiredMixin, View):
+    def post(self, request: HttpRequest) -> HttpResponseRedirect:
+        user = cast(User, request.user)
+
+        notification_ids = [
+            int(pk) for pk in request.POST.getlist("notification") if pk.isdigit()
+        ][: NotificationListView.page_size]
+
+        updated = Notification.objects.filter(
+            pk__in=notification_ids, user=user, is_read=False
+        ).update(is_read=True)
+        if updated:
+            decrement_unread_count(user.pk, updated)
+
+        return _redirect_to_list(request)
+
+
+class NotificationStreamView(View):
+    heartbeat_interval = 15
+    retry_interval = 5000
+
+    async def get(self, request: HttpRequest) -> HttpResponse | StreamingHttpResponse:
+        user = await request.auser()
+        if not user.is_authenticated:
+            return HttpResponse(status=401)
+
+        return StreamingHttpResponse(
+            self._stream(user.pk),
+            content_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
+
+    async def _stream(self, user_id: int) -> AsyncIterator[str]:
+        # Each connection is a coroutine parked on its queue, not a thread.
+        async with get_broker().subscribe(user_id) as queue:
+            yield f"retry: {self.retry_interval}\n\n"
+
+            while True:
+                try:
+                    payload = await asyncio.wait_for(
+                        queue.get(), self.heartbeat_interval
+                    )
+                except TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+
+                yield (
+                    f"id: {payload['id']}\n"
+                    "event: notification\n"
+                    f"data: {json.dumps(payload)}\n\n"
+                )
@@ -0,0 +1,100 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from decimal import Decimal
+
+import numpy as np
+import numpy.typing as npt
+
+FloatArray = npt.NDArray[np.float64]
+# Decimal model fields are accepted as is, numpy converts them to floats.
+Numbers = npt.ArrayLike | Sequence[Decimal | float]
+
+MAX_ESTIMATED_MAX = Decimal("999.9")
+
+
+class OneRepMaxEstimator(ABC):
+    def estimate(self, weight: float, repetitions: int) -> float:
+        return float(self.estimate_batch([weight], [repetitions])[0])
+
+    def estimate_batch(
+        self, weights: Numbers, repetitions: npt.ArrayLike
+    ) -> FloatArray:
+        repetitions = np.asarray(repetitions, dtype=np.float64)
+        if np.any(repetitions < 1):
+            raise ValueError("Repetitions must be at least 1.")
+        return self._estimate(np.asarray(weights, dtype=np.float64), repetitions)
+
+    @abstractmethod
+    def _estimate(self, weights: FloatArray, repetitions: FloatArray) -> FloatArray: ...
+
+
+class EpleyEstimator(OneRepMaxEstimator):
+    def _estimate(self, weights: FloatArray, repetitions: FloatArray) -> FloatArray:
+        return np.where(repetitions <= 1, weights, weights * (1 + repetitions / 30))
+
+
+class BrzyckiEstimator(OneRepMaxEstimator):
+    # The formula diverges at 37 repetitions, so longer sets are capped.
+    max_repetitions = 36
+
+    def _estimate(self, weights: FloatArray, repetitions: FloatArray) -> FloatArray:
+        repetitions = np.minimum(repetitions, self.max_repetitions)
+        estimates: FloatArray = weights * 36 / (37 - repetitions)
+        return estimates
+
+
+class LombardiEstimator(OneRepMaxEstimator):
+    def _estimate(self, weights: FloatArray, repetitions: FloatArray) -> FloatArray:
+        return weights * repetitions**0.1
+
+
+class RPETableEstimator(OneRepMaxEstimator):
+    # Percentage of 1RM that can be lifted for 1-12 repetitions at RPE 10.
+    # Every RPE point below 10 counts as one more repetition left in the tank.
+    # Past the table the percentage keeps falling along Epley's curve, scaled
+    # to meet the table's last entry, instead of staying at 68%.
+    percentages = np.array(
+        [100.0, 95.5, 92.2, 89.2, 86.3, 83.7, 81.1, 78.6, 76.2, 73.9, 70.7, 68.0]
+    )
+    table_repetitions = np.arange(1, len(percentages) + 1, dtype=np.float64)
+
+    def __init__(self, rpe: float = 10.0) -> None:
+        if not 1 <= rpe <= 10:
+            raise ValueError("RPE must be between 1 and 10.")
+        self.rpe = rpe
+
+    def _estimate(self, weights: FloatArray, repetitions: FloatArray) -> FloatArray:
+        effective_repetitions = repetitions + (10 - self.rpe)
+        last_repetitions = self.table_repetitions[-1]
+        percentages = np.where(
+            effective_repetitions <= last_repetitions,
+            np.interp(effective_repetitions, self.table_repetitions, self.percentages),
+            self.percentages[-1]
+            * (1 + last_repetitions / 30)
+            / (1 + effective_repetitions / 30),
+        )
+        estimates: FloatArray = weights * 100 / percentages
+        return estimates
+
+
+ESTIMATORS: dict[str, OneRepMaxEstimator] = {
+    "epley": EpleyEstimator(),
+    "brzycki": BrzyckiEstimator(),
+    "lombardi": LombardiEstimator(),
+    "rpe": RPETableEstimator(),
+}
+
+
+def get_estimator(formula: str) -> OneRepMaxEstimator:
+    try:
+        return ESTIMATORS[formula]
+    except KeyError:
+        raise ValueError(
+            f"Unknown one-rep max formula '{formula}', "
+            f"choose one of: {', '.join(ESTIMATORS)}"
+        ) from None
+
+
+def to_estimated_max(value: float) -> Decimal:
+    # Matches ExerciseSetPerformance.estimated_max, a DecimalField(4, 1).
+    return min(Decimal(f"{value:.1f}"), MAX_ESTIMATED_MAX)
@@ -0,0 +1,30 @@
+from typing import Any
+
+from django import forms
+from django.core.validators import MaxValueValidator, MinValueValidator
+
+
+class WorkoutLogForm(forms.Form):
+    bodyweight = forms.DecimalField(
+        max_digits=4, decimal_places=1, min_value=20, required=False
+    )
+
+
+class ExerciseSetPerformanceForm(forms.Form):
+    exercise_set = forms.IntegerField()
+    weight = forms.DecimalField(max_digits=4, decimal_places=1, min_value=0)
+    repetitions_done = forms.IntegerField(
+        validators=[MinValueValidator(1), MaxValueValidator(100)]
+    )
+
+    def __init__(self, *args: Any, exercise_set_ids: set[int], **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.exercise_set_ids = exercise_set_ids
+
+    def clean_exercise_set(self) -> int:
+        exercise_set: int = self.cleaned_data["exercise_set"]
+        if exercise_set not in self.exercise_set_ids:
+            raise forms.ValidationError(
+                "This set is not part of the workout.", code="invalid"
+            )
+        return exercise_set
@@ -0,0 +1,60 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management import BaseCommand, call_command
+from django.db import transaction
+
+from workout_performance.models import ExerciseSetPerformance
+from workout_performance.scoring import relative_score
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every performance, not only the ones without a score.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options["batch_size"]
+        performances = ExerciseSetPerformance.objects.all()
+        if not options["all"]:
+            performances = performances.filter(relative_score__isnull=True)
+
+        self.stdout.write("Backfilling relative score(s)...")
+
+        nb_updated = 0
+        last_pk = 0
+        while True:
+            rows = list(
+                performances.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list(
+                    "pk", "estimated_max", "bodyweight", "user__profile__gender"
+                )[:batch_size]
+            )
+            if not rows:
+                break
+
+            nb_updated += self._update_batch(rows)
+            last_pk = rows[-1][0]
+            self.stdout.write(f"Updated {nb_updated} performance(s)...")
+
+        self.stdout.write(f"Successfully backfilled {nb_updated} performance(s)!")
+
+        call_command("rebuild_prs", batch_size=batch_size, stdout=self.stdout)
+
+    @transaction.atomic
+    def _update_batch(self, rows: list[tuple]) -> int:
+        performances = [
+            ExerciseSetPerformance(
+                pk=pk,
+                relative_score=relative_score(estimated_max, bodyweight, gender),
+            )
+            for pk, estimated_max, bodyweight, gender in rows
+        ]
+        return ExerciseSetPerformance.objects.bulk_update(
+            performances, ["relative_score"]
+        )
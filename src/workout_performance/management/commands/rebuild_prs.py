@@ -0,0 +1,29 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management import BaseCommand, call_command
+from django.db import transaction
+
+from workout_performance.services import rebuild_personal_records
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options["batch_size"]
+
+        self.stdout.write("Rebuilding personal records...")
+
+        nb_records = self._rebuild_prs(batch_size)
+
+        self.stdout.write(f"Successfully rebuilt {nb_records} personal record(s)!")
+
+        call_command(
+            "groups_rebuild_rankings", batch_size=batch_size, stdout=self.stdout
+        )
+
+    @transaction.atomic
+    def _rebuild_prs(self, batch_size: int) -> int:
+        return rebuild_personal_records(batch_size)
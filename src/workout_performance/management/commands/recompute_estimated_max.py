@@ -0,0 +1,80 @@
+from argparse import ArgumentParser
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+from django.core.management import BaseCommand, CommandError, call_command
+from django.db import transaction
+
+from workout_performance.estimators import (
+    ESTIMATORS,
+    MAX_ESTIMATED_MAX,
+    OneRepMaxEstimator,
+    get_estimator,
+)
+from workout_performance.models import ExerciseSetPerformance
+from workout_performance.scoring import relative_scores_batch
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--formula", choices=list(ESTIMATORS), required=True)
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options["batch_size"]
+        try:
+            estimator = get_estimator(options["formula"])
+        except ValueError as e:
+            raise CommandError(e)
+
+        self.stdout.write(
+            f"Recomputing estimated max(es) with the {options['formula']} formula..."
+        )
+
+        nb_updated = 0
+        last_pk = 0
+        while True:
+            rows = list(
+                ExerciseSetPerformance.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list(
+                    "pk",
+                    "weight",
+                    "repetitions_done",
+                    "bodyweight",
+                    "user__profile__gender",
+                )[:batch_size]
+            )
+            if not rows:
+                break
+
+            nb_updated += self._update_batch(estimator, rows)
+            last_pk = rows[-1][0]
+            self.stdout.write(f"Updated {nb_updated} performance(s)...")
+
+        self.stdout.write(f"Successfully recomputed {nb_updated} performance(s)!")
+
+        call_command("rebuild_prs", batch_size=batch_size, stdout=self.stdout)
+
+    @transaction.atomic
+    def _update_batch(self, estimator: OneRepMaxEstimator, rows: list[tuple]) -> int:
+        pks, weights, repetitions, body_weights, genders = zip(*rows)
+
+        estimated_maxes = np.minimum(
+            np.round(estimator.estimate_batch(weights, repetitions), 1),
+            float(MAX_ESTIMATED_MAX),
+        )
+        scores = relative_scores_batch(estimated_maxes, body_weights, genders)
+
+        performances = [
+            ExerciseSetPerformance(
+                pk=pk,
+                estimated_max=Decimal(f"{estimated_max:.1f}"),
+                relative_score=None if np.isnan(score) else Decimal(f"{score:.2f}"),
+            )
+            for pk, estimated_max, score in zip(pks, estimated_maxes, scores)
+        ]
+        return ExerciseSetPerformance.objects.bulk_update(
+            performances, ["estimated_max", "relative_score"]
+        )
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout_performance", "0004_alter_exercisesetperformance_date_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exercisesetperformance",
+            name="user",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="exercise_set_performances",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations
+from django.db.models import Exists, F, OuterRef, Subquery
+
+
+def populate_user(apps, schema_editor):
+    ExerciseSetPerformance = apps.get_model(
+        "workout_performance", "ExerciseSetPerformance"
+    )
+    ExerciseSet = apps.get_model("training_plans", "ExerciseSet")
+    TrainingPlanUsage = apps.get_model("training_plans", "TrainingPlanUsage")
+
+    plan_owner = ExerciseSet.objects.filter(pk=OuterRef("exercise_set")).values(
+        "workout_exercise__workout__training_plan__user"
+    )[:1]
+
+    # The owner may always have logged a set of their own plan, anybody else
+    # only once they started using it. Rows another user may have logged are
+    # ambiguous and stay empty, records, rankings and volumes ignore them.
+    other_users = TrainingPlanUsage.objects.filter(
+        training_plan=OuterRef(
+            "exercise_set__workout_exercise__workout__training_plan"
+        ),
+        created_at__lte=OuterRef("date"),
+    ).exclude(user=F("training_plan__user"))
+
+    ExerciseSetPerformance.objects.filter(user__isnull=True).exclude(
+        Exists(other_users)
+    ).update(user=Subquery(plan_owner))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("training_plans", "0004_rename_set_index_exerciseset_set_number_and_more"),
+        ("workout_performance", "0005_exercisesetperformance_user"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_user, migrations.RunPython.noop),
+    ]
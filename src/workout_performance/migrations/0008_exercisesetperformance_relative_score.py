@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout_performance", "0006_populate_exercisesetperformance_user"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exercisesetperformance",
+            name="relative_score",
+            field=models.DecimalField(
+                db_index=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+    ]
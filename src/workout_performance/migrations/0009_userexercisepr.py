@@ -0,0 +1,56 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exercises", "0002_alter_exercise_description_and_more"),
+        ("workout_performance", "0008_exercisesetperformance_relative_score"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserExercisePR",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("estimated_max", models.DecimalField(decimal_places=1, max_digits=4)),
+                (
+                    "relative_score",
+                    models.DecimalField(decimal_places=2, max_digits=6, null=True),
+                ),
+                ("achieved_at", models.DateTimeField()),
+                (
+                    "exercise",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_prs",
+                        to="exercises.exercise",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="exercise_prs",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("user", "exercise")},
+            },
+        ),
+    ]
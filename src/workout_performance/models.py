@@ -1,5 +1,7 @@
 from django.db.models import Model, DecimalField, PositiveIntegerField, DateTimeField
 from django.db import models
+from django.contrib.auth.models import User
+from exercises.models import Exercise
 from training_plans.models import ExerciseSet
 
 
@@ -8,7 +10,33 @@ class ExerciseSetPerformance(Model):
     repetitions_done = PositiveIntegerField()
     estimated_max = DecimalField(max_digits=4, decimal_places=1)
     bodyweight = DecimalField(max_digits=4, decimal_places=1)
+    relative_score = DecimalField(
+        max_digits=6, decimal_places=2, null=True, db_index=True
+    )
     date = DateTimeField(auto_now_add=True)
     exercise_set = models.ForeignKey(
         ExerciseSet, on_delete=models.CASCADE, related_name="performances"
     )
+    # Only empty for rows logged before performances kept their user, when
+    # the backfill could not tell who logged them.
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="exercise_set_performances",
+        null=True,
+    )
+
+
+class UserExercisePR(Model):
+    estimated_max = DecimalField(max_digits=4, decimal_places=1)
+    relative_score = DecimalField(max_digits=6, decimal_places=2, null=True)
+    achieved_at = DateTimeField()
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="exercise_prs"
+    )
+    exercise = models.ForeignKey(
+        Exercise, on_delete=models.CASCADE, related_name="user_prs"
+    )
+
+    class Meta:
+        unique_together = (("user", "exercise"),)
@@ -0,0 +1,60 @@
+from collections.abc import Sequence
+from decimal import Decimal
+
+import numpy as np
+import numpy.typing as npt
+
+from accounts.models import Profile
+from workout_performance.estimators import FloatArray, Numbers
+
+# DOTS polynomial coefficients (a, b, c, d, e) and the body weight range the
+# formula is defined for, per gender.
+DOTS_COEFFICIENTS = {
+    Profile.Genders.MALE: (
+        -307.75076,
+        24.0900756,
+        -0.1918759221,
+        0.0007391293,
+        -0.000001093,
+    ),
+    Profile.Genders.FEMALE: (
+        -57.96288,
+        13.6175032,
+        -0.1126655495,
+        0.0005158568,
+        -0.0000010706,
+    ),
+}
+DOTS_BODY_WEIGHT_RANGE = {
+    Profile.Genders.MALE: (40.0, 210.0),
+    Profile.Genders.FEMALE: (40.0, 150.0),
+}
+
+
+def relative_score(
+    estimated_max: Decimal | float, body_weight: Decimal | float, gender: str | None
+) -> Decimal | None:
+    score = relative_scores_batch([estimated_max], [body_weight], [gender])[0]
+    return None if np.isnan(score) else Decimal(f"{score:.2f}")
+
+
+def relative_scores_batch(
+    estimated_maxes: Numbers,
+    body_weights: Numbers,
+    genders: npt.ArrayLike | Sequence[str | None],
+) -> FloatArray:
+    # Genders without coefficients, or missing, score NaN.
+    body_weights = np.asarray(body_weights, dtype=np.float64)
+    genders = np.asarray(genders, dtype=object)
+    coefficients = np.full(body_weights.shape, np.nan)
+
+    for gender, polynomial in DOTS_COEFFICIENTS.items():
+        mask = genders == gender
+        low, high = DOTS_BODY_WEIGHT_RANGE[gender]
+        weights = np.clip(body_weights[mask], low, high)
+        coefficients[mask] = 500 / np.polynomial.polynomial.polyval(weights, polynomial)
+
+    scores: FloatArray = np.round(
+        np.asarray(estimated_maxes, dtype=np.float64) * coefficients, 2
+    )
+    return scores
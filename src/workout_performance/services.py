@@ -0,0 +1,212 @@
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Max, Window
+from django.db.models.functions import RowNumber
+
+from accounts.models import Profile
+from analytics.rollups import add_weekly_volumes
+from groups.services import sync_rankings
+from training_plans.models import ExerciseSet
+from workout_performance.estimators import get_estimator, to_estimated_max
+from workout_performance.models import ExerciseSetPerformance, UserExercisePR
+from workout_performance.scoring import relative_score
+
+EXERCISE_LOOKUP = "exercise_set__workout_exercise__exercise"
+
+
+@transaction.atomic
+def log_performance(performance: ExerciseSetPerformance) -> ExerciseSetPerformance:
+    return log_performances([performance])[0]
+
+
+@transaction.atomic
+def log_performances(
+    performances: Iterable[ExerciseSetPerformance],
+    exercise_ids: dict[int, int] | None = None,
+) -> list[ExerciseSetPerformance]:
+    performances = list(performances)
+    if not performances:
+        return []
+
+    to_estimate = [
+        performance for performance in performances if performance.estimated_max is None
+    ]
+    if to_estimate:
+        estimator = get_estimator(settings.ONE_REP_MAX_FORMULA)
+        estimated_maxes = estimator.estimate_batch(
+            [performance.weight for performance in to_estimate],
+            [performance.repetitions_done for performance in to_estimate],
+        )
+        for performance, estimated_max in zip(to_estimate, estimated_maxes):
+            performance.estimated_max = to_estimated_max(estimated_max)
+
+    genders: dict[int | None, str] = dict(
+        Profile.objects.filter(
+            user__in={performance.user_id for performance in performances}
+        ).values_list("user_id", "gender")
+    )
+    for performance in performances:
+        performance.relative_score = relative_score(
+            performance.estimated_max,
+            performance.bodyweight,
+            genders.get(performance.user_id),
+        )
+
+    performances = ExerciseSetPerformance.objects.bulk_create(performances)
+
+    if exercise_ids is None:
+        exercise_ids = _exercise_ids(performances)
+
+    records = update_personal_records(performances, exercise_ids)
+    sync_rankings(records)
+    add_weekly_volumes(performances, exercise_ids)
+    return performances
+
+
+def update_personal_records(
+    performances: Iterable[ExerciseSetPerformance],
+    exercise_ids: dict[int, int] | None = None,
+) -> list[UserExercisePR]:
+    performances = list(performances)
+    if not performances:
+        return []
+
+    if exercise_ids is None:
+        exercise_ids = _exercise_ids(performances)
+
+    records = {
+        (record.user_id, record.exercise_id): record
+        for record in UserExercisePR.objects.select_for_update().filter(
+            user__in={performance.user_id for performance in performances},
+            exercise__in=set(exercise_ids.values()),
+        )
+    }
+
+    first_performances: dict[tuple[int, int], list[ExerciseSetPerformance]] = (
+        defaultdict(list)
+    )
+    records_to_update: dict[tuple[int, int], UserExercisePR] = {}
+    for performance in performances:
+        # Rows nobody could be attributed to never count towards a record.
+        if performance.user_id is None:
+            continue
+
+        key = (performance.user_id, exercise_ids[performance.exercise_set_id])
+        record = records.get(key)
+
+        if record is None:
+            first_performances[key].append(performance)
+        elif _improve_record(record, performance):
+            records_to_update[key] = record
+
+    if first_performances:
+        # There is no row to lock for a first record yet, and a concurrent log
+        # may insert the same one. Conflicting inserts are skipped, then every
+        # first record is locked and improved like the existing ones.
+        UserExercisePR.objects.bulk_create(
+            [
+                UserExercisePR(
+                    user_id=user_id,
+                    exercise_id=exercise_id,
+                    estimated_max=first[0].estimated_max,
+                    relative_score=first[0].relative_score,
+                    achieved_at=first[0].date,
+                )
+                for (user_id, exercise_id), first in first_performances.items()
+            ],
+            ignore_conflicts=True,
+        )
+        for record in UserExercisePR.objects.select_for_update().filter(
+            user__in={user_id for user_id, _ in first_performances},
+            exercise__in={exercise_id for _, exercise_id in first_performances},
+        ):
+            key = (record.user_id, record.exercise_id)
+            if key not in first_performances:
+                continue
+
+            for performance in first_performances[key]:
+                _improve_record(record, performance)
+            # Whether this transaction inserted it or not, the record is new
+            # to the groups' rankings, so it is always synced.
+            records_to_update[key] = record
+
+    UserExercisePR.objects.bulk_update(
+        records_to_update.values(), ["estimated_max", "relative_score", "achieved_at"]
+    )
+    return list(records_to_update.values())
+
+
+def _exercise_ids(performances: list[ExerciseSetPerformance]) -> dict[int, int]:
+    return dict(
+        ExerciseSet.objects.filter(
+            pk__in={performance.exercise_set_id for performance in performances}
+        ).values_list("pk", "workout_exercise__exercise")
+    )
+
+
+def _improve_record(
+    record: UserExercisePR, performance: ExerciseSetPerformance
+) -> bool:
+    improved = False
+
+    if performance.estimated_max > record.estimated_max:
+        record.estimated_max = performance.estimated_max
+        record.achieved_at = performance.date
+        improved = True
+
+    if performance.relative_score is not None and (
+        record.relative_score is None
+        or performance.relative_score > record.relative_score
+    ):
+        record.relative_score = performance.relative_score
+        improved = True
+
+    return improved
+
+
+def rebuild_personal_records(batch_size: int = 1000) -> int:
+    # One window-function query picks every (user, exercise) pair's best set,
+    # breaking ties by the earliest date, alongside its best relative score.
+    partition = [F("user"), F(EXERCISE_LOOKUP)]
+    rows = (
+        ExerciseSetPerformance.objects.filter(user__isnull=False)
+        .annotate(
+            position=Window(
+                RowNumber(),
+                partition_by=partition,
+                order_by=[F("estimated_max").desc(), F("date").asc()],
+            ),
+            best_relative_score=Window(Max("relative_score"), partition_by=partition),
+        )
+        .filter(position=1)
+        .values_list(
+            "user_id", EXERCISE_LOOKUP, "estimated_max", "best_relative_score", "date"
+        )
+    )
+
+    UserExercisePR.objects.all().delete()
+
+    created = 0
+    batch: list[UserExercisePR] = []
+    for user_id, exercise_id, estimated_max, score, achieved_at in rows.iterator(
+        chunk_size=batch_size
+    ):
+        batch.append(
+            UserExercisePR(
+                user_id=user_id,
+                exercise_id=exercise_id,
+                estimated_max=estimated_max,
+                relative_score=score,
+                achieved_at=achieved_at,
+            )
+        )
+
+        if len(batch) >= batch_size:
+            created += len(UserExercisePR.objects.bulk_create(batch))
+            batch = []
+
+    created += len(UserExercisePR.objects.bulk_create(batch))
+    return created
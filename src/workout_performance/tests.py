@@ -1,3 +1,214 @@
-from django.test import TestCase
+import json
+from decimal import Decimal
+from typing import Any
 
-# Create your tests here.
+import numpy as np
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from accounts.models import Profile
+from exercises.models import Exercise
+from groups.models import Group, GroupMembership, GroupRanking
+from training_plans.models import ExerciseSet, TrainingPlan, Workout, WorkoutExercise
+from workout_performance.estimators import (
+    ESTIMATORS,
+    BrzyckiEstimator,
+    EpleyEstimator,
+    LombardiEstimator,
+    RPETableEstimator,
+    get_estimator,
+)
+from workout_performance.models import ExerciseSetPerformance, UserExercisePR
+from workout_performance.scoring import relative_score, relative_scores_batch
+
+MALE = Profile.Genders.MALE
+FEMALE = Profile.Genders.FEMALE
+
+
+class EstimatorTests(SimpleTestCase):
+    def test_single_repetition_is_the_max(self) -> None:
+        for name, estimator in ESTIMATORS.items():
+            with self.subTest(name):
+                self.assertAlmostEqual(estimator.estimate(100, 1), 100)
+
+    def test_known_values(self) -> None:
+        self.assertAlmostEqual(EpleyEstimator().estimate(100, 10), 133.33, places=2)
+        self.assertAlmostEqual(BrzyckiEstimator().estimate(100, 10), 133.33, places=2)
+        self.assertAlmostEqual(LombardiEstimator().estimate(100, 10), 125.89, places=2)
+        self.assertAlmostEqual(RPETableEstimator().estimate(100, 5), 115.87, places=2)
+
+    def test_brzycki_caps_long_sets(self) -> None:
+        estimator = BrzyckiEstimator()
+        self.assertEqual(estimator.estimate(100, 40), estimator.estimate(100, 36))
+
+    def test_rpe_counts_repetitions_left_in_the_tank(self) -> None:
+        self.assertAlmostEqual(
+            RPETableEstimator(rpe=8).estimate(100, 3),
+            RPETableEstimator().estimate(100, 5),
+        )
+
+    def test_rpe_keeps_increasing_past_the_table(self) -> None:
+        estimates = RPETableEstimator().estimate_batch([100] * 3, [12, 13, 20])
+        self.assertTrue(estimates[0] < estimates[1] < estimates[2])
+
+    def test_batch_accepts_decimal_weights(self) -> None:
+        estimates = EpleyEstimator().estimate_batch(
+            [Decimal("100.0"), Decimal("60.5")], [10, 1]
+        )
+        self.assertAlmostEqual(estimates[0], 133.33, places=2)
+        self.assertAlmostEqual(estimates[1], 60.5)
+
+    def test_rejects_invalid_repetitions(self) -> None:
+        for name, estimator in ESTIMATORS.items():
+            with self.subTest(name), self.assertRaises(ValueError):
+                estimator.estimate_batch([100, 100], [5, 0])
+
+    def test_rejects_invalid_rpe(self) -> None:
+        for rpe in (0, 10.5):
+            with self.subTest(rpe), self.assertRaises(ValueError):
+                RPETableEstimator(rpe=rpe)
+
+    def test_rejects_unknown_formula(self) -> None:
+        with self.assertRaises(ValueError):
+            get_estimator("unknown")
+
+
+class RelativeScoreTests(SimpleTestCase):
+    def test_matches_reference_dots_scores(self) -> None:
+        # Reference DOTS scores for a total at a given body weight.
+        self.assertEqual(relative_score(700, 100, MALE), Decimal("430.86"))
+        self.assertEqual(relative_score(500, 80, MALE), Decimal("344.77"))
+        self.assertEqual(relative_score(400, 60, FEMALE), Decimal("443.42"))
+        self.assertEqual(relative_score(300, 52, FEMALE), Decimal("365.67"))
+
+    def test_clamps_body_weight_to_the_formula_range(self) -> None:
+        self.assertEqual(relative_score(700, 250, MALE), relative_score(700, 210, MALE))
+        self.assertEqual(
+            relative_score(300, 30, FEMALE), relative_score(300, 40, FEMALE)
+        )
+        self.assertNotEqual(
+            relative_score(300, 150, FEMALE), relative_score(300, 140, FEMALE)
+        )
+
+    def test_scores_nothing_without_a_gender(self) -> None:
+        self.assertIsNone(relative_score(100, 80, None))
+
+    def test_batch_matches_single_scores(self) -> None:
+        estimated_maxes: list[Decimal | float] = [Decimal("700.0"), 400, 100]
+        body_weights: list[Decimal | float] = [100, Decimal("60.0"), 80]
+        scores = relative_scores_batch(
+            estimated_maxes, body_weights, [MALE, FEMALE, None]
+        )
+
+        self.assertEqual(scores[0], 430.86)
+        self.assertEqual(scores[1], 443.42)
+        self.assertTrue(np.isnan(scores[2]))
+
+
+class WorkoutLogViewTests(TestCase):
+    user: User
+    group: Group
+    exercise: Exercise
+    workout: Workout
+    exercise_set: ExerciseSet
+    url: str
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user("lifter", password="pass")
+        Profile.objects.create(
+            user=cls.user, gender=MALE, age=30, body_weight=Decimal("80.0")
+        )
+        cls.group = Group.objects.create(
+            name="Lifters", description="Group", admin_user=cls.user
+        )
+        GroupMembership.objects.create(
+            user=cls.user,
+            group=cls.group,
+            status=GroupMembership.MembershipStatus.ACCEPTED,
+        )
+
+        cls.exercise = Exercise.objects.create(
+            name=Exercise.Exercises.SQUAT, description="Squat"
+        )
+        plan = TrainingPlan.objects.create(
+            name="Plan", description="Plan", user=cls.user
+        )
+        cls.workout = Workout.objects.create(
+            name="Legs", description="Legs", day="monday", training_plan=plan
+        )
+        workout_exercise = WorkoutExercise.objects.create(
+            workout=cls.workout, exercise=cls.exercise
+        )
+        cls.exercise_set = ExerciseSet.objects.create(
+            set_number=1, repetitions=5, workout_exercise=workout_exercise
+        )
+        cls.url = reverse("workout_log", kwargs={"workout_pk": cls.workout.pk})
+
+    def _post(self, payload: object) -> dict[str, Any]:
+        response = self.client.post(
+            self.url, json.dumps(payload), content_type="application/json"
+        )
+        return {"status": response.status_code, **response.json()}
+
+    def test_anonymous_requests_get_a_json_401(self) -> None:
+        response = self._post({"performances": []})
+
+        self.assertEqual(response["status"], 401)
+        self.assertIn("errors", response)
+
+    def test_rejects_invalid_payloads(self) -> None:
+        self.client.force_login(self.user)
+
+        payloads: list[object] = [
+            [],
+            {"performances": "nope"},
+            {"performances": []},
+            {
+                "performances": [
+                    {"exercise_set": 0, "weight": "100", "repetitions_done": 5}
+                ]
+            },
+            {
+                "performances": [
+                    {
+                        "exercise_set": self.exercise_set.pk,
+                        "weight": "x",
+                        "repetitions_done": 0,
+                    }
+                ]
+            },
+        ]
+        for payload in payloads:
+            with self.subTest(payload):
+                self.assertEqual(self._post(payload)["status"], 400)
+
+        self.assertFalse(ExerciseSetPerformance.objects.exists())
+
+    def test_logs_performances_and_updates_records_and_rankings(self) -> None:
+        self.client.force_login(self.user)
+
+        response = self._post(
+            {
+                "performances": [
+                    {
+                        "exercise_set": self.exercise_set.pk,
+                        "weight": "100",
+                        "repetitions_done": 6,
+                    }
+                ]
+            }
+        )
+
+        self.assertEqual(response["status"], 201)
+        self.assertEqual(response["created"], 1)
+
+        record = UserExercisePR.objects.get(user=self.user, exercise=self.exercise)
+        self.assertEqual(record.estimated_max, Decimal("120.0"))
+        self.assertEqual(record.relative_score, relative_score(120, 80, MALE))
+
+        ranking = GroupRanking.objects.get(
+            user=self.user, group=self.group, exercise=self.exercise
+        )
+        self.assertEqual(ranking.estimated_max, record.estimated_max)
@@ -0,0 +1,11 @@
+from django.urls import path
+
+from .views import WorkoutLogView
+
+urlpatterns = [
+    path(
+        "workouts/<int:workout_pk>/log/",
+        WorkoutLogView.as_view(),
+        name="workout_log",
+    ),
+]
@@ -1,3 +1,132 @@
-from django.shortcuts import render
+import json
+from typing import Any
 
-# Create your views here.
+from django.contrib.auth.models import User
+from django.http import HttpRequest, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.views import View
+
+from accounts.models import Profile
+from training_plans.models import ExerciseSet, TrainingPlanUsage, Workout
+from workout_performance.forms import ExerciseSetPerformanceForm, WorkoutLogForm
+from workout_performance.models import ExerciseSetPerformance
+from workout_performance.services import log_performances
+
+
+class WorkoutLogView(View):
+    def post(self, request: HttpRequest, workout_pk: int) -> JsonResponse:
+        # An API client gets a status it can act on, not a login page redirect.
+        if not request.user.is_authenticated:
+            return JsonResponse({"errors": "Authentication required."}, status=401)
+
+        user = request.user
+        workout = get_object_or_404(
+            Workout.objects.select_related("training_plan"), pk=workout_pk
+        )
+
+        if not self._can_log(user, workout):
+            return JsonResponse(
+                {"errors": "You can't log performances for this workout!"}, status=403
+            )
+
+        try:
+            payload = json.loads(request.body)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return JsonResponse({"errors": "Payload must be valid JSON."}, status=400)
+
+        if not isinstance(payload, dict) or not isinstance(
+            payload.get("performances"), list
+        ):
+            return JsonResponse(
+                {"errors": "Payload must contain a list of performances."}, status=400
+            )
+
+        exercise_ids = dict(
+            ExerciseSet.objects.filter(workout_exercise__workout=workout).values_list(
+                "pk", "workout_exercise__exercise"
+            )
+        )
+
+        log_form = WorkoutLogForm(payload)
+        performance_forms = [
+            ExerciseSetPerformanceForm(
+                item if isinstance(item, dict) else {},
+                exercise_set_ids=set(exercise_ids),
+            )
+            for item in payload["performances"]
+        ]
+
+        errors = self._collect_errors(log_form, performance_forms)
+        if errors:
+            return JsonResponse({"errors": errors}, status=400)
+
+        bodyweight = log_form.cleaned_data["bodyweight"] or (
+            Profile.objects.filter(user=user)
+            .values_list("body_weight", flat=True)
+            .first()
+        )
+        if bodyweight is None:
+            return JsonResponse({"errors": {"bodyweight": "Required."}}, status=400)
+
+        performances = log_performances(
+            [
+                ExerciseSetPerformance(
+                    exercise_set_id=form.cleaned_data["exercise_set"],
+                    weight=form.cleaned_data["weight"],
+                    repetitions_done=form.cleaned_data["repetitions_done"],
+                    bodyweight=bodyweight,
+                    user=user,
+                )
+                for form in performance_forms
+            ],
+            exercise_ids,
+        )
+
+        return JsonResponse(
+            {
+                "created": len(performances),
+                "performances": [
+                    {
+                        "exercise_set": performance.exercise_set_id,
+                        "estimated_max": performance.estimated_max,
+                        "relative_score": performance.relative_score,
+                    }
+                    for performance in performances
+                ],
+            },
+            status=201,
+        )
+
+    def _can_log(self, user: User, workout: Workout) -> bool:
+        return (
+            workout.training_plan.user_id == user.pk
+            or TrainingPlanUsage.objects.filter(
+                training_plan=workout.training_plan, user=user
+            ).exists()
+        )
+
+    def _collect_errors(
+        self,
+        log_form: WorkoutLogForm,
+        performance_forms: list[ExerciseSetPerformanceForm],
+    ) -> dict[str, Any]:
+        errors: dict[str, Any] = {}
+
+        if not log_form.is_valid():
+            errors.update(log_form.errors.get_json_data())
+
+        if not performance_forms:
+            errors["performances"] = "At least one performance is required."
+
+        logged_sets = set()
+        for i, form in enumerate(performance_forms):
+            if not form.is_valid():
+                errors[f"performances.{i}"] = form.errors.get_json_data()
+                continue
+
+            exercise_set = form.cleaned_data["exercise_set"]
+            if exercise_set in logged_sets:
+                errors[f"performances.{i}"] = "This set was already logged."
+            logged_sets.add(exercise_set)
+
+        return errors